@@ -5,7 +5,7 @@ import os
 # .env 파일 로드
 from dotenv import load_dotenv
 from pydantic import field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 load_dotenv()
 
@@ -109,12 +109,11 @@ class Settings(BaseSettings):
             return [self.admin_frontend_url]
         return self.cors_origins
 
-    class Config:
-        """Pydantic config."""
-
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"  # 추가 필드 무시
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",  # 추가 필드 무시
+    )
 
 
 # 설정 인스턴스 생성
@@ -44,6 +44,9 @@ from app.database import Base
 # Admin 모델 임포트
 from app.models_admin import Admin
 
+# 스키마와 공유하는 Enum 임포트
+from app.schemas._enums import UserRole
+
 # RBAC 모델 임포트
 
 # ===========================================
@@ -51,13 +54,6 @@ from app.models_admin import Admin
 # ===========================================
 
 
-class UserRole(enum.Enum):
-    """사용자 역할"""
-
-    USER = "USER"
-    ADMIN = "ADMIN"
-
-
 class TravelPlanStatus(enum.Enum):
     """여행 계획 상태"""
 
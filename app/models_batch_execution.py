@@ -41,8 +41,20 @@ class BatchJobExecution(Base):
     # 결과 정보
     error_message = Column(Text)
     result_summary = Column(JSONB)
+
+    # 작업 로그 (batch_job_logs.job_id 에 FK가 없으므로 조인 조건을 직접 지정, 읽기 전용)
+    logs = relationship(
+        "BatchJobLog",
+        primaryjoin="BatchJobExecution.id == foreign(BatchJobLog.job_id)",
+        order_by="BatchJobLog.start_time",
+        viewonly=True,
+    )
     
     # 인덱스
     __table_args__ = (
         # 복합 인덱스 추가 가능
-    )
\ No newline at end of file
+    )
+
+# logs 관계가 문자열로 참조하는 BatchJobLog(app.models) 매퍼 등록
+# (이 모듈만 임포트한 경우에도 매퍼 구성 시 이름을 찾을 수 있도록 함)
+import app.models  # noqa: E402,F401
@@ -337,37 +337,38 @@ async def get_region_hierarchy(
             Region.region_level, Region.region_name
         ).all()
         
-        # 계층 구조 구성
-        region_dict = {region.region_code: region for region in regions}
-        tree = []
-        
-        # 1차 지역 (광역시도) 찾기
+        # 계층 구조 구성: 상위 지역 코드별 하위 지역을 한 번의 순회로 묶음
+        children_by_parent = {}
+        provinces = []
+        total_cities = 0
         for region in regions:
             if region.region_level == 1:
-                region_node = {
+                provinces.append(region)
+            elif region.region_level == 2:
+                total_cities += 1
+            if region.parent_region_code:
+                children_by_parent.setdefault(region.parent_region_code, []).append({
                     "region_code": region.region_code,
                     "region_name": region.region_name,
                     "region_level": region.region_level,
                     "children": []
-                }
-                
-                # 하위 지역 찾기
-                for child_region in regions:
-                    if child_region.parent_region_code == region.region_code:
-                        child_node = {
-                            "region_code": child_region.region_code,
-                            "region_name": child_region.region_name,
-                            "region_level": child_region.region_level,
-                            "children": []
-                        }
-                        region_node["children"].append(child_node)
-                
-                tree.append(region_node)
+                })
+
+        # 1차 지역 (광역시도) 노드에 하위 지역 연결
+        tree = [
+            {
+                "region_code": region.region_code,
+                "region_name": region.region_name,
+                "region_level": region.region_level,
+                "children": children_by_parent.get(region.region_code, [])
+            }
+            for region in provinces
+        ]
         
         return {
             "tree": tree,
-            "total_provinces": len([r for r in regions if r.region_level == 1]),
-            "total_cities": len([r for r in regions if r.region_level == 2])
+            "total_provinces": len(provinces),
+            "total_cities": total_cities
         }
         
     except Exception as e:
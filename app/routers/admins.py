@@ -1,6 +1,6 @@
 import math
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from ..auth.rbac_dependencies import require_permission, require_super_admin
@@ -157,13 +157,15 @@ async def get_admin_list(
     # 총 페이지 수 계산
     total_pages = math.ceil(total / size)
 
-    return AdminListResponse(
+    # 이미 검증된 모델을 한 번만 JSON으로 직렬화하여 응답 (response_model 재검증 생략)
+    result = AdminListResponse(
         admins=admin_responses,
         total=total,
         page=page,
         size=size,
         total_pages=total_pages,
     )
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/stats")
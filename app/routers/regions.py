@@ -1,6 +1,7 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/regions", tags=["regions"])
 
+# 지역 목록 검증용 어댑터 (모듈 로드 시 한 번만 생성)
+_REGION_LIST = TypeAdapter(list[RegionResponse])
+
 
 @router.get("/missing-coordinates")
 async def get_missing_coordinates(
@@ -175,15 +179,16 @@ async def get_regions(
         query = query.order_by(Region.region_code)
         query = query.offset((page - 1) * size).limit(size)
 
-        regions = query.all()
-
-        return {
-            "regions": regions,
-            "total": total,
-            "page": page,
-            "size": size,
-            "total_pages": (total + size - 1) // size
-        }
+        # ORM 객체 목록을 한 번에 검증하고 응답은 한 번만 직렬화 (response_model 재검증 생략)
+        regions = _REGION_LIST.validate_python(query.all(), from_attributes=True)
+        result = RegionListResponse.model_construct(
+            regions=regions,
+            total=total,
+            page=page,
+            size=size,
+            total_pages=(total + size - 1) // size,
+        )
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to get regions: {str(e)}")
         raise HTTPException(status_code=500, detail="지역 목록 조회 실패")
@@ -11,6 +11,7 @@ from ..database import get_db
 from ..models import Restaurant, Region
 from ..dependencies import CurrentAdmin, require_permission
 from ..utils.category_mapping import normalize_category_data
+from ..utils.json_response import orjson_response
 
 router = APIRouter(prefix="/restaurants", tags=["Restaurants"])
 
@@ -89,10 +90,10 @@ async def get_all_restaurants(
         
         items.append(item)
     
-    return {
+    return orjson_response({
         "total": total,
         "items": items
-    }
+    })
 
 @router.get("/{content_id}")
 @require_permission("destinations.read")
@@ -3,12 +3,13 @@ from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import TravelCourse, CategoryCode
 from ..utils.category_mapping import normalize_category_data
+from ..utils.json_response import orjson_response
 
 
 def safe_float(val: Any) -> float | None:
@@ -54,8 +55,7 @@ class TravelCourseResponse(BaseModel):
     detail_intro_info: dict | None = None
     detail_additional_info: dict | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 router = APIRouter(prefix="/travel-courses", tags=["Travel Courses"])
 
@@ -79,7 +79,7 @@ def get_all_travel_courses(
         query = query.filter(TravelCourse.region_code == region)
     total = query.count()
     courses = query.order_by(TravelCourse.created_at.desc()).offset(offset).limit(limit).all()
-    return {
+    return orjson_response({
         "total": total,
         "items": [
             {
@@ -124,7 +124,7 @@ def get_all_travel_courses(
             }
             for c in courses
         ]
-    }
+    })
 
 @router.get("/region-count")
 def get_region_count(db: Session = Depends(get_db)):
@@ -1,11 +1,24 @@
+import asyncio
 import logging
 from datetime import datetime
+from typing import Any
+from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import SessionLocal, get_db
+from ..utils.job_status import JobStatusStore
+from ..utils.json_response import orjson_response
+from ..utils.response_cache import (
+    cache_delete_if_equal,
+    cache_set_if_absent,
+    cached_response,
+    clear_cache,
+)
 from ..services.weather_service import (
     MAJOR_CITIES,
     KTOWeatherService,
@@ -25,8 +38,282 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/weather", tags=["Weather"])
 
+# 도시 목록은 고정값이므로 응답/오류 메시지를 미리 만들어 둡니다.
+_CITY_NAMES_CSV = ", ".join(MAJOR_CITIES.keys())
+_WEATHER_INFO_LIST = TypeAdapter(list[WeatherInfo])
+_CITIES_BYTES = orjson.dumps([city.model_dump() for city in MAJOR_CITIES.values()])
+_UNSUPPORTED_DETAIL = f"지원하지 않는 도시입니다. 사용 가능한 도시: {_CITY_NAMES_CSV}"
+
+# /health 응답 중 변하지 않는 부분 (첫 요청 시 구성)
+_health_base: dict | None = None
+
+# 응답 캐시 키에 포함할 쿼리 파라미터 (도시명은 경로에 포함되어 있음)
+_CACHE_KEY_PARAMS = frozenset({"nx", "ny", "location", "limit"})
+
+# 수집 작업 상태 보관 시간 및 저장소 (Redis, 장애 시 프로세스 메모리)
+_COLLECT_JOB_TTL = 24 * 60 * 60
+_collect_jobs = JobStatusStore("weather_collect_job", _COLLECT_JOB_TTL)
+
+# 빈 데이터 업데이트 작업 상태 저장소 (보관 시간은 수집 작업과 동일)
+_update_empty_jobs = JobStatusStore("weather_update_empty_job", _COLLECT_JOB_TTL)
+
+# 빈 데이터 업데이트 실행 잠금 (Redis, 워커 간 동시 실행 방지)
+# 값은 잠금을 점유한 job_id 이며, 작업이 비정상 종료되어도 TTL 이후 자동 해제됩니다.
+_UPDATE_EMPTY_LOCK_KEY = "weather_update_empty_job:lock"
+_UPDATE_EMPTY_LOCK_TTL = 60 * 60
+
+# ==================== SQL 문 ====================
+# 요청마다 text()를 다시 만들지 않도록 모듈 로드 시 한 번만 생성합니다.
+# 온도 컬럼은 float8 로 캐스팅하고 평균/반올림도 SQL에서 계산하여 드라이버가 바로 float를 반환하도록 합니다.
+
+# 지역별 최신 예보 + 전체 온도 통계 (/summary-forecast)
+_SUMMARY_FORECAST_SQL = text("""
+    WITH latest AS (
+        SELECT DISTINCT ON (wf.region_code)
+               wf.region_code,
+               wf.min_temp::float8 as min_temp,
+               wf.max_temp::float8 as max_temp,
+               round(((wf.min_temp::numeric + wf.max_temp::numeric) / 2), 1)::float8 as avg_temp,
+               wf.weather_condition,
+               wf.precipitation_prob,
+               wf.forecast_date as latest_forecast_date,
+               wf.created_at as latest_created_at,
+               COALESCE(r.region_name_full, r.region_name, '지역코드_' || wf.region_code) as display_name
+        FROM weather_forecast wf
+        LEFT JOIN regions r ON r.region_code = wf.region_code AND r.is_active = true
+        WHERE wf.min_temp IS NOT NULL
+        AND wf.max_temp IS NOT NULL
+        AND wf.forecast_date >= CURRENT_DATE - INTERVAL '3 days'
+        ORDER BY wf.region_code, wf.forecast_date DESC, wf.created_at DESC
+    )
+    SELECT latest.*, stats.*
+    FROM latest
+    CROSS JOIN (
+        SELECT round(avg(avg_temp)::numeric, 1)::float8 as summary_avg_temp,
+               max(avg_temp) as summary_max_temp,
+               min(avg_temp) as summary_min_temp,
+               (array_agg(display_name ORDER BY avg_temp DESC, region_code))[1] as summary_max_region,
+               (array_agg(display_name ORDER BY avg_temp ASC, region_code))[1] as summary_min_region,
+               max(latest_created_at) as summary_last_updated
+        FROM latest
+    ) stats
+    ORDER BY latest.region_code
+""")
+
+# 지역별 최신 예보 목록 (/database/forecast-data)
+_FORECAST_DATA_SQL = text("""
+    WITH latest_forecasts AS (
+        SELECT DISTINCT ON (region_code)
+               region_code,
+               min_temp::float8 as min_temp,
+               max_temp::float8 as max_temp,
+               round(((min_temp::numeric + max_temp::numeric) / 2), 1)::float8 as avg_temp,
+               weather_condition,
+               precipitation_prob,
+               forecast_date,
+               created_at
+        FROM weather_forecast
+        WHERE min_temp IS NOT NULL
+        AND max_temp IS NOT NULL
+        AND forecast_date >= CURRENT_DATE - INTERVAL '3 days'
+        ORDER BY region_code, forecast_date DESC, created_at DESC
+    )
+    SELECT lf.*, r.region_name, r.region_name_full
+    FROM latest_forecasts lf
+    LEFT JOIN regions r ON lf.region_code = r.region_code
+    ORDER BY lf.created_at DESC
+    LIMIT :limit
+""")
+
+# 지역별 최신 실황 목록 (/database/current-data)
+_CURRENT_DATA_SQL = text("""
+    WITH latest_current AS (
+        SELECT DISTINCT ON (region_code)
+               region_code,
+               avg_temp::numeric as avg_temp,
+               max_temp::numeric as max_temp,
+               min_temp::numeric as min_temp,
+               humidity,
+               wind_speed,
+               visibility,
+               uv_index,
+               precipitation,
+               weather_condition,
+               weather_date,
+               created_at
+        FROM weather_current
+        WHERE avg_temp IS NOT NULL
+        AND weather_date >= CURRENT_DATE - INTERVAL '7 days'
+        ORDER BY region_code, weather_date DESC, created_at DESC
+    )
+    SELECT lc.*, r.region_name, r.region_name_full
+    FROM latest_current lc
+    LEFT JOIN regions r ON lc.region_code = r.region_code
+    ORDER BY lc.created_at DESC
+    LIMIT :limit
+""")
+
+
+# 수집 통계 집계 (/collect/stats)
+# created_at 에 함수를 씌우지 않고 반열린 범위로 비교하여 created_at 인덱스를 사용합니다.
+_COLLECT_STATS_SQL = text("""
+    WITH today AS (
+        SELECT region_code
+        FROM weather_forecast
+        WHERE created_at >= CURRENT_DATE
+        AND created_at < CURRENT_DATE + 1
+    )
+    SELECT
+        (SELECT COUNT(DISTINCT region_code) FROM regions WHERE is_active = true) as total_regions,
+        (SELECT COUNT(DISTINCT region_code) FROM today) as collected_regions,
+        (SELECT COUNT(*) FROM today) as today_collection_count,
+        (SELECT MAX(created_at) FROM weather_forecast) as last_collection_time
+""")
+
+# 최근 24시간 수집 이력 (/collect/stats)
+_COLLECT_HISTORY_SQL = text("""
+    SELECT
+        wf.region_code,
+        r.region_name,
+        wf.created_at as collected_at,
+        CASE
+            WHEN wf.min_temp IS NOT NULL AND wf.max_temp IS NOT NULL
+            THEN 'success'
+            ELSE 'failed'
+        END as status
+    FROM weather_forecast wf
+    LEFT JOIN regions r ON wf.region_code = r.region_code
+    WHERE wf.created_at >= NOW() - INTERVAL '24 hours'
+    ORDER BY wf.created_at DESC
+    LIMIT 10
+""")
+
+
+# 빈 데이터 일괄 업데이트 트랜잭션 잠금 (/update-empty-data)
+# Redis 잠금이 만료되거나 우회된 경우에도 일괄 UPDATE가 동시에 실행되지 않도록 합니다.
+_EMPTY_DATA_LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('weather_update_empty_data'))")
+
+# 빈 필드가 있는 실황 레코드 (/update-empty-data)
+_EMPTY_DATA_RECORDS_SQL = text("""
+    SELECT id, region_code, region_name, weather_date,
+           avg_temp, max_temp, min_temp, humidity,
+           precipitation, wind_speed, weather_condition,
+           visibility, uv_index
+    FROM weather_current
+    WHERE precipitation IS NULL
+       OR visibility IS NULL
+       OR uv_index IS NULL
+    ORDER BY weather_date DESC, region_code
+    LIMIT 100
+""")
+
+# 빈 날씨 데이터 보완용 api_raw_data 후보 조회 (/update-empty-data)
+# (지역명, 날짜) 쌍마다 최근 응답 최대 5개를 LATERAL 조인으로 한 번에 가져옵니다.
+# 날짜 조건은 created_at 반열린 범위로 비교하여 created_at 인덱스를 사용합니다.
+_EMPTY_DATA_RAW_CANDIDATES_SQL = text("""
+    SELECT k.region_name, k.weather_date, ard.id, ard.raw_response
+    FROM unnest(CAST(:region_names AS text[]), CAST(:weather_dates AS date[]))
+         AS k(region_name, weather_date)
+    CROSS JOIN LATERAL (
+        SELECT id, raw_response, created_at
+        FROM api_raw_data
+        WHERE api_provider = 'WEATHER'
+          AND response_status = 200
+          AND raw_response IS NOT NULL
+          AND created_at >= k.weather_date
+          AND created_at < k.weather_date + 1
+          AND (
+            request_params->>'region' = k.region_name
+            OR request_params->>'city' = k.region_name
+            OR raw_response::text LIKE '%' || k.region_name || '%'
+          )
+        ORDER BY created_at DESC
+        LIMIT 5
+    ) ard
+    ORDER BY k.region_name, k.weather_date, ard.created_at DESC
+""")
+
+# 빈 필드 업데이트 후 상태 확인 (/update-empty-data)
+_EMPTY_DATA_STATUS_SQL = text("""
+    SELECT
+        COUNT(*) as total,
+        SUM(CASE WHEN precipitation IS NULL THEN 1 ELSE 0 END) as null_precipitation,
+        SUM(CASE WHEN visibility IS NULL THEN 1 ELSE 0 END) as null_visibility,
+        SUM(CASE WHEN uv_index IS NULL THEN 1 ELSE 0 END) as null_uv_index
+    FROM weather_current
+""")
+
+# 빈 필드 일괄 업데이트 대상 컬럼의 실제 타입 조회 (/update-empty-data)
+# weather_current 는 배치 시스템이 관리하는 테이블이므로 ORM 모델이 아닌 DB 카탈로그의 정의를 사용합니다.
+_EMPTY_DATA_COLUMNS = ("id", "precipitation", "visibility", "uv_index", "raw_data_id")
+_EMPTY_DATA_COLUMN_TYPES_SQL = text("""
+    SELECT attname, format_type(atttypid, atttypmod)
+    FROM pg_attribute
+    WHERE attrelid = 'weather_current'::regclass
+      AND attname = ANY(:columns)
+      AND attnum > 0
+      AND NOT attisdropped
+""")
+
+# 빈 필드 일괄 업데이트 + 업데이트 후 상태 확인 (/update-empty-data)
+# 레코드별 값을 JSON 배열 하나로 전달하여 UPDATE ... FROM jsonb_to_recordset() 한 문장으로 처리합니다
+# (null 이면 기존 값 유지).
+# jsonb_to_recordset 의 컬럼 타입은 weather_current 의 실제 컬럼 타입으로 채워 비교/대입 시 타입이 일치하도록 합니다.
+# 같은 문장의 SELECT 는 UPDATE 이전 스냅샷을 보므로 갱신된 행은 RETURNING 값을 사용합니다.
+_EMPTY_DATA_UPDATE_SQL_TEMPLATE = """
+    WITH updated AS (
+        UPDATE weather_current wc
+        SET precipitation = COALESCE(v.precipitation, wc.precipitation),
+            visibility = COALESCE(v.visibility, wc.visibility),
+            uv_index = COALESCE(v.uv_index, wc.uv_index),
+            raw_data_id = COALESCE(v.raw_data_id, wc.raw_data_id),
+            updated_at = now()
+        FROM jsonb_to_recordset(CAST(:patches AS jsonb)) AS v(
+            id {id},
+            precipitation {precipitation},
+            visibility {visibility},
+            uv_index {uv_index},
+            raw_data_id {raw_data_id}
+        )
+        WHERE wc.id = v.id
+        RETURNING wc.id, wc.precipitation, wc.visibility, wc.uv_index
+    )
+    SELECT
+        COUNT(*) as total,
+        SUM(CASE WHEN COALESCE(u.precipitation, wc.precipitation) IS NULL THEN 1 ELSE 0 END) as null_precipitation,
+        SUM(CASE WHEN COALESCE(u.visibility, wc.visibility) IS NULL THEN 1 ELSE 0 END) as null_visibility,
+        SUM(CASE WHEN COALESCE(u.uv_index, wc.uv_index) IS NULL THEN 1 ELSE 0 END) as null_uv_index,
+        (SELECT COUNT(*) FROM updated) as updated_count
+    FROM weather_current wc
+    LEFT JOIN updated u ON u.id = wc.id
+"""
+
+# 컬럼 타입을 채운 일괄 업데이트 문 (프로세스당 첫 업데이트 시 한 번만 구성)
+_empty_data_update_sql = None
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Pydantic 모델을 한 번만 JSON으로 직렬화하여 응답 (response_model 재검증 생략)"""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _forecast_list_response(forecasts: list[WeatherInfo]) -> Response:
+    """예보 목록을 한 번만 JSON으로 직렬화하여 응답"""
+    return Response(content=_WEATHER_INFO_LIST.dump_json(forecasts), media_type="application/json")
+
+
+def get_valid_city(city_name: str) -> LocationCoordinate:
+    """
+    경로의 도시명을 검증하고 해당 도시의 좌표를 반환합니다.
+    """
+    coordinate = MAJOR_CITIES.get(city_name)
+    if coordinate is None:
+        raise HTTPException(status_code=400, detail=_UNSUPPORTED_DETAIL)
+    return coordinate
+
 
-@router.get("/current", response_model=WeatherInfo)
+@router.get("/current", response_model=None, responses={200: {"model": WeatherInfo}})
+@cached_response(expire=600, stale_on_error=True, key_params=_CACHE_KEY_PARAMS)
 async def get_current_weather(
     nx: int = Query(60, description="예보지점 X 좌표 (기본값: 서울)"),
     ny: int = Query(127, description="예보지점 Y 좌표 (기본값: 서울)"),
@@ -44,15 +331,15 @@ async def get_current_weather(
         # 디버그 정보 로깅
         logger.info(f"날씨 조회 요청: nx={nx}, ny={ny}, location={location}")
 
-        weather = weather_service.get_current_weather(nx, ny, location)
+        weather = await weather_service.get_current_weather(nx, ny, location)
         if not weather:
             # 더 구체적인 404 메시지
             error_detail = f"날씨 정보를 찾을 수 없습니다. 좌표: ({nx}, {ny}), 지역: {location}. "
             error_detail += "기상청 API에서 해당 시간대의 데이터를 제공하지 않거나, API 키 설정에 문제가 있을 수 있습니다. "
-            error_detail += "/api/weather/debug/api-test 엔드포인트로 API 상태를 확인해보세요."
+            error_detail += "/api/weather/health 엔드포인트로 API 설정 상태를 확인해보세요."
             raise HTTPException(status_code=404, detail=error_detail)
 
-        return weather
+        return _model_response(weather)
 
     except HTTPException:
         raise
@@ -61,7 +348,8 @@ async def get_current_weather(
         raise HTTPException(status_code=500, detail=f"날씨 정보 조회 중 오류가 발생했습니다: {str(e)}")
 
 
-@router.get("/forecast", response_model=list[WeatherInfo])
+@router.get("/forecast", response_model=None, responses={200: {"model": list[WeatherInfo]}})
+@cached_response(expire=1800, stale_on_error=True, key_params=_CACHE_KEY_PARAMS)
 async def get_weather_forecast(
     nx: int = Query(60, description="예보지점 X 좌표 (기본값: 서울)"),
     ny: int = Query(127, description="예보지점 Y 좌표 (기본값: 서울)"),
@@ -76,17 +364,19 @@ async def get_weather_forecast(
     - **location**: 지역명 (선택사항)
     """
     try:
-        forecasts = weather_service.get_weather_forecast(nx, ny, location)
-        return forecasts
+        forecasts = await weather_service.get_weather_forecast(nx, ny, location)
+        return _forecast_list_response(forecasts)
 
     except Exception as e:
         logger.error(f"날씨 예보 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="날씨 예보 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/current/{city_name}", response_model=WeatherInfo)
+@router.get("/current/{city_name}", response_model=None, responses={200: {"model": WeatherInfo}})
+@cached_response(expire=600, stale_on_error=True, key_params=_CACHE_KEY_PARAMS)
 async def get_current_weather_by_city(
     city_name: str,
+    coordinate: LocationCoordinate = Depends(get_valid_city),
     weather_service: KTOWeatherService = Depends(get_weather_service)
 ):
     """
@@ -94,21 +384,13 @@ async def get_current_weather_by_city(
 
     - **city_name**: 도시명 (서울, 부산, 대구, 인천, 광주, 대전, 울산, 세종, 경기, 강원, 충북, 충남, 전북, 전남, 경북, 경남, 제주)
     """
-    if city_name not in MAJOR_CITIES:
-        available_cities = ", ".join(MAJOR_CITIES.keys())
-        raise HTTPException(
-            status_code=400,
-            detail=f"지원하지 않는 도시입니다. 사용 가능한 도시: {available_cities}"
-        )
-
     try:
-        coordinate = MAJOR_CITIES[city_name]
-        weather = weather_service.get_current_weather(coordinate.nx, coordinate.ny, coordinate.name)
+        weather = await weather_service.get_current_weather(coordinate.nx, coordinate.ny, coordinate.name)
 
         if not weather:
             raise HTTPException(status_code=404, detail=f"{city_name}의 날씨 정보를 찾을 수 없습니다.")
 
-        return weather
+        return _model_response(weather)
 
     except HTTPException:
         raise
@@ -117,9 +399,11 @@ async def get_current_weather_by_city(
         raise HTTPException(status_code=500, detail="날씨 정보 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/forecast/{city_name}", response_model=list[WeatherInfo])
+@router.get("/forecast/{city_name}", response_model=None, responses={200: {"model": list[WeatherInfo]}})
+@cached_response(expire=1800, stale_on_error=True, key_params=_CACHE_KEY_PARAMS)
 async def get_weather_forecast_by_city(
     city_name: str,
+    coordinate: LocationCoordinate = Depends(get_valid_city),
     weather_service: KTOWeatherService = Depends(get_weather_service)
 ):
     """
@@ -127,18 +411,10 @@ async def get_weather_forecast_by_city(
 
     - **city_name**: 도시명 (서울, 부산, 대구, 인천, 광주, 대전, 울산, 세종, 경기, 강원, 충북, 충남, 전북, 전남, 경북, 경남, 제주)
     """
-    if city_name not in MAJOR_CITIES:
-        available_cities = ", ".join(MAJOR_CITIES.keys())
-        raise HTTPException(
-            status_code=400,
-            detail=f"지원하지 않는 도시입니다. 사용 가능한 도시: {available_cities}"
-        )
-
     try:
-        coordinate = MAJOR_CITIES[city_name]
-        forecasts = weather_service.get_weather_forecast(coordinate.nx, coordinate.ny, coordinate.name)
+        forecasts = await weather_service.get_weather_forecast(coordinate.nx, coordinate.ny, coordinate.name)
 
-        return forecasts
+        return _forecast_list_response(forecasts)
 
     except HTTPException:
         raise
@@ -147,15 +423,16 @@ async def get_weather_forecast_by_city(
         raise HTTPException(status_code=500, detail="날씨 예보 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/cities", response_model=list[LocationCoordinate])
+@router.get("/cities", responses={200: {"model": list[LocationCoordinate]}})
 async def get_available_cities():
     """
     사용 가능한 도시 목록 조회
     """
-    return list(MAJOR_CITIES.values())
+    # 직렬화된 응답을 그대로 반환하여 요청마다 검증/직렬화하지 않음
+    return Response(content=_CITIES_BYTES, media_type="application/json")
 
 
-@router.post("/ultra-srt-ncst", response_model=WeatherResponse)
+@router.post("/ultra-srt-ncst", response_model=None, responses={200: {"model": WeatherResponse}})
 async def get_ultra_srt_ncst(
     request: UltraSrtNcstRequest,
     weather_service: KTOWeatherService = Depends(get_weather_service)
@@ -166,18 +443,18 @@ async def get_ultra_srt_ncst(
     관광공사 API를 직접 호출하여 원본 응답을 반환합니다.
     """
     try:
-        response = weather_service.get_ultra_srt_ncst(request)
+        response = await weather_service.get_ultra_srt_ncst(request)
         if not response:
             raise HTTPException(status_code=404, detail="초단기실황 정보를 찾을 수 없습니다.")
 
-        return response
+        return _model_response(response)
 
     except Exception as e:
         logger.error(f"초단기실황 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="초단기실황 조회 중 오류가 발생했습니다.")
 
 
-@router.post("/ultra-srt-fcst", response_model=WeatherResponse)
+@router.post("/ultra-srt-fcst", response_model=None, responses={200: {"model": WeatherResponse}})
 async def get_ultra_srt_fcst(
     request: UltraSrtFcstRequest,
     weather_service: KTOWeatherService = Depends(get_weather_service)
@@ -188,18 +465,18 @@ async def get_ultra_srt_fcst(
     관광공사 API를 직접 호출하여 원본 응답을 반환합니다.
     """
     try:
-        response = weather_service.get_ultra_srt_fcst(request)
+        response = await weather_service.get_ultra_srt_fcst(request)
         if not response:
             raise HTTPException(status_code=404, detail="초단기예보 정보를 찾을 수 없습니다.")
 
-        return response
+        return _model_response(response)
 
     except Exception as e:
         logger.error(f"초단기예보 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="초단기예보 조회 중 오류가 발생했습니다.")
 
 
-@router.post("/vilage-fcst", response_model=WeatherResponse)
+@router.post("/vilage-fcst", response_model=None, responses={200: {"model": WeatherResponse}})
 async def get_vilage_fcst(
     request: VilageFcstRequest,
     weather_service: KTOWeatherService = Depends(get_weather_service)
@@ -210,11 +487,11 @@ async def get_vilage_fcst(
     관광공사 API를 직접 호출하여 원본 응답을 반환합니다.
     """
     try:
-        response = weather_service.get_vilage_fcst(request)
+        response = await weather_service.get_vilage_fcst(request)
         if not response:
             raise HTTPException(status_code=404, detail="단기예보 정보를 찾을 수 없습니다.")
 
-        return response
+        return _model_response(response)
 
     except Exception as e:
         logger.error(f"단기예보 조회 실패: {e}")
@@ -226,15 +503,18 @@ async def weather_health_check(weather_service: KTOWeatherService = Depends(get_
     """
     날씨 서비스 상태 확인
     """
-    return {
-        "status": "healthy",
-        "service": "weather",
-        "timestamp": datetime.now().isoformat(),
-        "available_cities": len(MAJOR_CITIES),
-        "api_key_configured": bool(weather_service.api_key),
-        "api_key_length": len(weather_service.api_key) if weather_service.api_key else 0,
-        "base_url": weather_service.base_url
-    }
+    global _health_base
+    # 시작 이후 변하지 않는 값은 한 번만 구성하고 timestamp만 갱신
+    if _health_base is None:
+        _health_base = {
+            "status": "healthy",
+            "service": "weather",
+            "available_cities": len(MAJOR_CITIES),
+            "api_key_configured": bool(weather_service.api_key),
+            "api_key_length": len(weather_service.api_key) if weather_service.api_key else 0,
+            "base_url": weather_service.base_url
+        }
+    return {**_health_base, "timestamp": datetime.now().isoformat()}
 
 
 # ==================== 데이터베이스 관련 엔드포인트 ====================
@@ -244,30 +524,81 @@ async def weather_health_check(weather_service: KTOWeatherService = Depends(get_
 
 # ==================== 데이터 수집 엔드포인트 ====================
 
-@router.post("/collect/all")
-async def collect_all_cities_data():
+async def _run_collection(job_id: str, include_forecast: bool):
     """
-    모든 주요 도시의 날씨 데이터를 수집하고 데이터베이스에 저장
+    백그라운드에서 날씨 데이터 수집을 실행하고 결과를 저장합니다.
     """
+    job = {
+        "job_id": job_id,
+        "status": "running",
+        "include_forecast": include_forecast,
+        "started_at": datetime.now().isoformat(),
+        "finished_at": None,
+        "result": None,
+        "error": None
+    }
+    await _collect_jobs.save(job_id, job)
+
     try:
-        result = await weather_collector.collect_all_cities_weather(include_forecast=True)
-        return result
+        result = await weather_collector.collect_all_cities_weather(include_forecast=include_forecast)
+        logger.info(
+            f"Weather collection job {job_id} finished. "
+            f"Success: {result.get('success_count', 0)}, Failed: {result.get('failed_count', 0)}"
+        )
+        job.update(status="completed", result=result)
+        # 새로 수집된 데이터가 반영되도록 날씨 응답 캐시 무효화
+        await clear_cache()
     except Exception as e:
-        logger.error(f"Collect all cities error: {e}")
-        raise HTTPException(status_code=500, detail="날씨 데이터 수집 중 오류가 발생했습니다.")
+        logger.error(f"Weather collection job {job_id} error: {e}", exc_info=True)
+        job.update(status="failed", error=str(e))
+
+    job["finished_at"] = datetime.now().isoformat()
+    await _collect_jobs.save(job_id, job)
+
 
+async def _start_collection(background_tasks: BackgroundTasks, include_forecast: bool) -> dict[str, Any]:
+    """수집 작업을 등록하고 job_id를 반환"""
+    job_id = uuid4().hex
+    pending = {"job_id": job_id, "status": "pending", "include_forecast": include_forecast}
+    if not await _collect_jobs.save(job_id, pending):
+        # 다른 워커에서 상태를 조회할 수 없으므로 작업을 접수하지 않습니다.
+        _collect_jobs.discard(job_id)
+        raise HTTPException(status_code=503, detail="작업 상태 저장소를 사용할 수 없어 수집 작업을 시작할 수 없습니다.")
+    background_tasks.add_task(_run_collection, job_id, include_forecast)
+    return {"status": "accepted", "job_id": job_id}
 
-@router.post("/collect/current")
-async def collect_current_weather_data():
+
+@router.post("/collect/all", status_code=202)
+async def collect_all_cities_data(background_tasks: BackgroundTasks):
     """
-    모든 주요 도시의 현재 날씨만 수집하고 데이터베이스에 저장
+    모든 주요 도시의 날씨 데이터 수집을 백그라운드 작업으로 시작
+
+    진행 상황은 /collect/status/{job_id} 엔드포인트로 확인합니다.
+    작업 상태 저장소(Redis)를 사용할 수 없으면 작업을 시작하지 않고 503을 반환합니다.
     """
-    try:
-        result = await weather_collector.collect_current_weather_only()
-        return result
-    except Exception as e:
-        logger.error(f"Collect current weather error: {e}")
-        raise HTTPException(status_code=500, detail="현재 날씨 데이터 수집 중 오류가 발생했습니다.")
+    return await _start_collection(background_tasks, True)
+
+
+@router.post("/collect/current", status_code=202)
+async def collect_current_weather_data(background_tasks: BackgroundTasks):
+    """
+    모든 주요 도시의 현재 날씨 수집을 백그라운드 작업으로 시작
+
+    진행 상황은 /collect/status/{job_id} 엔드포인트로 확인합니다.
+    작업 상태 저장소(Redis)를 사용할 수 없으면 작업을 시작하지 않고 503을 반환합니다.
+    """
+    return await _start_collection(background_tasks, False)
+
+
+@router.get("/collect/status/{job_id}")
+async def get_collection_job_status(job_id: str):
+    """
+    날씨 데이터 수집 작업 상태 조회
+    """
+    job = await _collect_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="수집 작업 정보를 찾을 수 없습니다.")
+    return Response(content=job, media_type="application/json")
 
 
 @router.get("/collect/stats")
@@ -276,61 +607,22 @@ async def get_collection_stats(db: Session = Depends(get_db)):
     데이터 수집 통계 조회
     """
     try:
-        # 전체 지역 수와 수집된 지역 수 조회
-        total_regions_query = text("""
-            SELECT COUNT(DISTINCT region_code) as total
-            FROM regions
-            WHERE is_active = true
-        """)
-        total_regions = db.execute(total_regions_query).scalar()
-
-        collected_regions_query = text("""
-            SELECT COUNT(DISTINCT region_code) as collected
-            FROM weather_forecast
-            WHERE DATE(created_at) = CURRENT_DATE
-        """)
-        collected_regions = db.execute(collected_regions_query).scalar()
-
-        # 오늘 수집 횟수
-        today_collection_query = text("""
-            SELECT COUNT(*) as count
-            FROM weather_forecast
-            WHERE DATE(created_at) = CURRENT_DATE
-        """)
-        today_collection_count = db.execute(today_collection_query).scalar()
-
-        # 마지막 수집 시간
-        last_collection_query = text("""
-            SELECT MAX(created_at) as last_time
-            FROM weather_forecast
-        """)
-        last_collection_time = db.execute(last_collection_query).scalar()
+        # 지역 수/오늘 수집 현황/마지막 수집 시간을 한 번의 왕복으로 조회
+        stats = db.execute(_COLLECT_STATS_SQL).mappings().one()
+        total_regions = stats["total_regions"]
+        collected_regions = stats["collected_regions"]
+        today_collection_count = stats["today_collection_count"]
+        last_collection_time = stats["last_collection_time"]
 
         # 최근 수집 이력 (예시)
-        collection_history_query = text("""
-            SELECT 
-                wf.region_code,
-                r.region_name,
-                wf.created_at as collected_at,
-                CASE 
-                    WHEN wf.min_temp IS NOT NULL AND wf.max_temp IS NOT NULL 
-                    THEN 'success' 
-                    ELSE 'failed' 
-                END as status
-            FROM weather_forecast wf
-            LEFT JOIN regions r ON wf.region_code = r.region_code
-            WHERE wf.created_at >= NOW() - INTERVAL '24 hours'
-            ORDER BY wf.created_at DESC
-            LIMIT 10
-        """)
-        collection_history = db.execute(collection_history_query).fetchall()
+        collection_history = db.execute(_COLLECT_HISTORY_SQL).mappings().all()
 
         history_list = [
             {
-                "region_code": row.region_code,
-                "region_name": row.region_name or f"지역코드_{row.region_code}",
-                "collected_at": row.collected_at.isoformat() if row.collected_at else None,
-                "status": row.status
+                "region_code": row["region_code"],
+                "region_name": row["region_name"] or f"지역코드_{row['region_code']}",
+                "collected_at": row["collected_at"],
+                "status": row["status"]
             }
             for row in collection_history
         ]
@@ -340,17 +632,17 @@ async def get_collection_stats(db: Session = Depends(get_db)):
         successful_collections = len(history_list) - failed_collections
         error_rate = round((failed_collections / len(history_list) * 100), 1) if history_list else 0
 
-        return {
+        return orjson_response({
             "total_regions": total_regions or 0,
             "collected_regions": collected_regions or 0,
             "today_collection_count": today_collection_count or 0,
-            "last_collection_time": last_collection_time.isoformat() if last_collection_time else None,
+            "last_collection_time": last_collection_time,
             "collection_history": history_list,
             "failed_collections": failed_collections,
             "successful_collections": successful_collections,
             "error_rate": error_rate,
             "next_collection_time": None  # 배치 스케줄러와 연동 필요
-        }
+        })
     except Exception as e:
         logger.error(f"Get collection stats error: {e}")
         raise HTTPException(status_code=500, detail="수집 통계 조회 중 오류가 발생했습니다.")
@@ -359,18 +651,33 @@ async def get_collection_stats(db: Session = Depends(get_db)):
 
 
 @router.get("/summary")
-def get_weather_summary(weather_service: KTOWeatherService = Depends(get_weather_service)):
+@cached_response(expire=300, stale_on_error=True, key_params=_CACHE_KEY_PARAMS)
+async def get_weather_summary(weather_service: KTOWeatherService = Depends(get_weather_service)):
     """
     주요 도시들의 현재 날씨 요약 및 통계 반환
     """
     cities = list(MAJOR_CITIES.keys())
+    # 도시별 기상청 API 호출을 동시에 수행 (총 소요 시간 ≈ 가장 느린 1회 호출)
+    results = await asyncio.gather(
+        *(weather_service.get_current_weather_by_city(city_name) for city_name in cities),
+        return_exceptions=True
+    )
     regions = []
-    temps = []
+    temp_sum = 0.0
+    max_temp = min_temp = None
+    max_region = min_region = None
     now = None
-    for city_name in cities:
-        weather = weather_service.get_current_weather_by_city(city_name)
+    for city_name, weather in zip(cities, results):
+        if isinstance(weather, Exception):
+            logger.warning(f"{city_name} 날씨 요약 조회 실패: {weather}")
+            continue
         if weather and weather.temperature is not None:
-            temps.append(weather.temperature)
+            temp = weather.temperature
+            temp_sum += temp
+            if max_temp is None or temp > max_temp:
+                max_temp, max_region = temp, city_name
+            if min_temp is None or temp < min_temp:
+                min_temp, min_region = temp, city_name
             regions.append({
                 "city_name": city_name,
                 "region_code": MAJOR_CITIES[city_name].nx,
@@ -382,11 +689,10 @@ def get_weather_summary(weather_service: KTOWeatherService = Depends(get_weather
             })
             if not now or (weather.forecast_time and weather.forecast_time > now):
                 now = weather.forecast_time
-    avg_temp = round(sum(temps) / len(temps), 1) if temps else None
-    max_temp = max(temps) if temps else None
-    min_temp = min(temps) if temps else None
-    max_region = next((r["city_name"] for r in regions if r["temperature"] == max_temp), None)
-    min_region = next((r["city_name"] for r in regions if r["temperature"] == min_temp), None)
+    if not regions and all(isinstance(weather, Exception) for weather in results):
+        # 모든 도시 조회가 실패하면 빈 요약을 캐싱하지 않고 오류로 처리하여 stale 캐시 응답을 사용
+        raise HTTPException(status_code=502, detail="기상청 API에서 날씨 정보를 가져올 수 없습니다.")
+    avg_temp = round(temp_sum / len(regions), 1) if regions else None
     last_updated = now.isoformat() if now else None
     return {
         "regions": regions,
@@ -405,28 +711,15 @@ def get_weather_summary(weather_service: KTOWeatherService = Depends(get_weather
 
 
 @router.get("/summary-forecast")
+@cached_response(expire=300, key_params=_CACHE_KEY_PARAMS)
 def get_weather_summary_from_forecasts(db: Session = Depends(get_db)):
     """
     weather_forecast 테이블에서 날씨 통계 데이터를 제공합니다.
     최신 예보 데이터를 기반으로 주요 지역별 온도 통계를 계산합니다.
     """
     try:
-        # 최신 예보 데이터 조회 (지역별 가장 최근 데이터)
-        subquery = text("""
-            SELECT DISTINCT region_code,
-                   FIRST_VALUE(min_temp::numeric) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as min_temp,
-                   FIRST_VALUE(max_temp::numeric) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as max_temp,
-                   FIRST_VALUE(weather_condition) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as weather_condition,
-                   FIRST_VALUE(precipitation_prob) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as precipitation_prob,
-                   FIRST_VALUE(forecast_date) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as latest_forecast_date,
-                   FIRST_VALUE(created_at) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as latest_created_at
-            FROM weather_forecast 
-            WHERE min_temp IS NOT NULL 
-            AND max_temp IS NOT NULL 
-            AND forecast_date >= CURRENT_DATE - INTERVAL '3 days'
-        """)
-
-        result = db.execute(subquery).fetchall()
+        # 최신 예보 데이터 조회 (지역별 가장 최근 데이터) + 전체 통계를 한 번에 계산
+        result = db.execute(_SUMMARY_FORECAST_SQL).mappings().all()
 
         if not result:
             return {
@@ -443,64 +736,37 @@ def get_weather_summary_from_forecasts(db: Session = Depends(get_db)):
                 }
             }
 
-        # 지역 정보 매핑을 위한 쿼리
-        region_query = text("""
-            SELECT region_code, region_name, region_name_full
-            FROM regions 
-            WHERE is_active = true
-        """)
-        regions_data = db.execute(region_query).fetchall()
-        region_map = {r.region_code: r.region_name_full or r.region_name for r in regions_data}
-
         regions = []
-        temps = []
-
         for row in result:
-            # 평균 온도 계산 (최저온도와 최고온도의 평균)
-            avg_temp = (float(row.min_temp) + float(row.max_temp)) / 2
-            temps.append(avg_temp)
-
-            region_name = region_map.get(row.region_code, f"지역코드_{row.region_code}")
-
             regions.append({
-                "city_name": region_name,
-                "region_code": row.region_code,
-                "region_name": region_name,
-                "temperature": round(avg_temp, 1),
-                "min_temp": float(row.min_temp),
-                "max_temp": float(row.max_temp),
-                "weather_condition": row.weather_condition,
-                "precipitation_prob": row.precipitation_prob,
-                "last_updated": row.latest_created_at.isoformat() if row.latest_created_at else None
+                "city_name": row["display_name"],
+                "region_code": row["region_code"],
+                "region_name": row["display_name"],
+                "temperature": row["avg_temp"],
+                "min_temp": row["min_temp"],
+                "max_temp": row["max_temp"],
+                "weather_condition": row["weather_condition"],
+                "precipitation_prob": row["precipitation_prob"],
+                "last_updated": row["latest_created_at"]
             })
 
-        # 통계 계산
-        avg_temp = round(sum(temps) / len(temps), 1) if temps else None
-        max_temp = max(temps) if temps else None
-        min_temp = min(temps) if temps else None
-
-        max_region_data = next((r for r in regions if r["temperature"] == max_temp), None)
-        min_region_data = next((r for r in regions if r["temperature"] == min_temp), None)
-
-        max_region = max_region_data["region_name"] if max_region_data else None
-        min_region = min_region_data["region_name"] if min_region_data else None
+        # 통계는 SQL에서 계산된 값을 사용 (모든 행에 동일한 값이 포함됨)
+        stats = result[0]
+        latest_update = stats["summary_last_updated"]
 
-        # 가장 최근 업데이트 시간
-        latest_update = max((r["last_updated"] for r in regions if r["last_updated"]), default=None)
-
-        return {
+        return orjson_response({
             "regions": regions,
             "summary": {
                 "region_count": len(regions),
-                "avg_temp": avg_temp,
-                "max_temp": max_temp,
-                "min_temp": min_temp,
-                "max_region": max_region,
-                "min_region": min_region,
+                "avg_temp": stats["summary_avg_temp"],
+                "max_temp": stats["summary_max_temp"],
+                "min_temp": stats["summary_min_temp"],
+                "max_region": stats["summary_max_region"],
+                "min_region": stats["summary_min_region"],
                 "last_updated": latest_update,
                 "data_source": "weather_forecast"
             }
-        }
+        })
 
     except Exception as e:
         logger.error(f"Weather forecast summary 조회 실패: {e}", exc_info=True)
@@ -508,8 +774,9 @@ def get_weather_summary_from_forecasts(db: Session = Depends(get_db)):
 
 
 @router.get("/database/forecast-data")
+@cached_response(expire=120, key_params=_CACHE_KEY_PARAMS)
 def get_forecast_weather_data(
-    limit: int = Query(20, description="반환할 데이터 수"),
+    limit: int = Query(20, ge=1, le=500, description="반환할 데이터 수 (최대 500)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -518,30 +785,7 @@ def get_forecast_weather_data(
     """
     try:
         # 지역별 최신 예보 데이터 조회
-        query = text("""
-            WITH latest_forecasts AS (
-                SELECT DISTINCT region_code,
-                       FIRST_VALUE(min_temp::numeric) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as min_temp,
-                       FIRST_VALUE(max_temp::numeric) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as max_temp,
-                       FIRST_VALUE(weather_condition) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as weather_condition,
-                       FIRST_VALUE(precipitation_prob) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as precipitation_prob,
-                       FIRST_VALUE(forecast_date) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as forecast_date,
-                       FIRST_VALUE(created_at) OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as created_at,
-                       ROW_NUMBER() OVER (PARTITION BY region_code ORDER BY forecast_date DESC, created_at DESC) as rn
-                FROM weather_forecast 
-                WHERE min_temp IS NOT NULL 
-                AND max_temp IS NOT NULL 
-                AND forecast_date >= CURRENT_DATE - INTERVAL '3 days'
-            )
-            SELECT lf.*, r.region_name, r.region_name_full
-            FROM latest_forecasts lf
-            LEFT JOIN regions r ON lf.region_code = r.region_code
-            WHERE lf.rn = 1
-            ORDER BY lf.created_at DESC
-            LIMIT :limit
-        """)
-
-        result = db.execute(query, {"limit": limit}).fetchall()
+        result = db.execute(_FORECAST_DATA_SQL, {"limit": limit}).mappings().all()
 
         if not result:
             return {
@@ -553,34 +797,32 @@ def get_forecast_weather_data(
         # 응답 데이터 구성
         weather_data = []
         for row in result:
-            # 평균 온도 계산
-            avg_temp = (float(row.min_temp) + float(row.max_temp)) / 2
-            city_name = row.region_name_full or row.region_name or f"지역코드_{row.region_code}"
+            city_name = row["region_name_full"] or row["region_name"] or f"지역코드_{row['region_code']}"
 
             weather_data.append({
-                "id": f"forecast_{row.region_code}",
+                "id": f"forecast_{row['region_code']}",
                 "city_name": city_name,
-                "region_code": row.region_code,
-                "temperature": round(avg_temp, 1),
-                "min_temp": float(row.min_temp),
-                "max_temp": float(row.max_temp),
-                "weather_description": row.weather_condition,
-                "weather_condition": row.weather_condition,
-                "precipitation_prob": row.precipitation_prob,
+                "region_code": row["region_code"],
+                "temperature": row["avg_temp"],
+                "min_temp": row["min_temp"],
+                "max_temp": row["max_temp"],
+                "weather_description": row["weather_condition"],
+                "weather_condition": row["weather_condition"],
+                "precipitation_prob": row["precipitation_prob"],
                 "humidity": None,  # forecasts 테이블에는 없음
                 "wind_speed": None,  # forecasts 테이블에는 없음
-                "sky_condition": row.weather_condition,
-                "forecast_date": row.forecast_date.isoformat() if row.forecast_date else None,
-                "last_updated": row.created_at.isoformat() if row.created_at else None,
+                "sky_condition": row["weather_condition"],
+                "forecast_date": row["forecast_date"],
+                "last_updated": row["created_at"],
                 "data_source": "weather_forecast"
             })
 
-        return {
+        return orjson_response({
             "success": True,
             "data": weather_data,
             "count": len(weather_data),
             "message": f"weather_forecast 테이블에서 {len(weather_data)}개 지역의 날씨 데이터를 조회했습니다."
-        }
+        })
 
     except Exception as e:
         logger.error(f"Forecast weather data 조회 실패: {e}", exc_info=True)
@@ -588,8 +830,9 @@ def get_forecast_weather_data(
 
 
 @router.get("/database/current-data")
+@cached_response(expire=120, key_params=_CACHE_KEY_PARAMS)
 def get_current_weather_data(
-    limit: int = Query(20, description="반환할 데이터 수"),
+    limit: int = Query(20, ge=1, le=500, description="반환할 데이터 수 (최대 500)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -598,34 +841,7 @@ def get_current_weather_data(
     """
     try:
         # 지역별 최신 실시간 날씨 데이터 조회
-        query = text("""
-            WITH latest_current AS (
-                SELECT DISTINCT region_code,
-                       FIRST_VALUE(avg_temp::numeric) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as avg_temp,
-                       FIRST_VALUE(max_temp::numeric) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as max_temp,
-                       FIRST_VALUE(min_temp::numeric) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as min_temp,
-                       FIRST_VALUE(humidity) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as humidity,
-                       FIRST_VALUE(wind_speed) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as wind_speed,
-                       FIRST_VALUE(visibility) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as visibility,
-                       FIRST_VALUE(uv_index) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as uv_index,
-                       FIRST_VALUE(precipitation) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as precipitation,
-                       FIRST_VALUE(weather_condition) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as weather_condition,
-                       FIRST_VALUE(weather_date) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as weather_date,
-                       FIRST_VALUE(created_at) OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as created_at,
-                       ROW_NUMBER() OVER (PARTITION BY region_code ORDER BY weather_date DESC, created_at DESC) as rn
-                FROM weather_current 
-                WHERE avg_temp IS NOT NULL 
-                AND weather_date >= CURRENT_DATE - INTERVAL '7 days'
-            )
-            SELECT lc.*, r.region_name, r.region_name_full
-            FROM latest_current lc
-            LEFT JOIN regions r ON lc.region_code = r.region_code
-            WHERE lc.rn = 1
-            ORDER BY lc.created_at DESC
-            LIMIT :limit
-        """)
-
-        result = db.execute(query, {"limit": limit}).fetchall()
+        result = db.execute(_CURRENT_DATA_SQL, {"limit": limit}).mappings().all()
 
         if not result:
             return {
@@ -637,69 +853,149 @@ def get_current_weather_data(
         # 응답 데이터 구성
         weather_data = []
         for row in result:
-            city_name = row.region_name_full or row.region_name or f"지역코드_{row.region_code}"
+            city_name = row["region_name_full"] or row["region_name"] or f"지역코드_{row['region_code']}"
             
             weather_data.append({
-                "id": f"current_{row.region_code}",
+                "id": f"current_{row['region_code']}",
                 "city_name": city_name,
-                "region_code": row.region_code,
-                "temperature": round(float(row.avg_temp), 1) if row.avg_temp else None,
-                "min_temp": float(row.min_temp) if row.min_temp else None,
-                "max_temp": float(row.max_temp) if row.max_temp else None,
-                "humidity": row.humidity,
-                "wind_speed": row.wind_speed,
-                "visibility": row.visibility,
-                "uv_index": row.uv_index,
-                "precipitation": row.precipitation,
-                "weather_description": row.weather_condition,
-                "weather_condition": row.weather_condition,
-                "sky_condition": row.weather_condition,
-                "weather_date": row.weather_date.isoformat() if row.weather_date else None,
-                "last_updated": row.created_at.isoformat() if row.created_at else None,
+                "region_code": row["region_code"],
+                "temperature": round(float(row["avg_temp"]), 1) if row["avg_temp"] else None,
+                "min_temp": float(row["min_temp"]) if row["min_temp"] else None,
+                "max_temp": float(row["max_temp"]) if row["max_temp"] else None,
+                "humidity": row["humidity"],
+                "wind_speed": row["wind_speed"],
+                "visibility": row["visibility"],
+                "uv_index": row["uv_index"],
+                "precipitation": row["precipitation"],
+                "weather_description": row["weather_condition"],
+                "weather_condition": row["weather_condition"],
+                "sky_condition": row["weather_condition"],
+                "weather_date": row["weather_date"],
+                "last_updated": row["created_at"],
                 "data_source": "weather_current"
             })
 
-        return {
+        return orjson_response({
             "success": True,
             "data": weather_data,
             "count": len(weather_data),
             "message": f"weather_current 테이블에서 {len(weather_data)}개 지역의 실시간 날씨 데이터를 조회했습니다."
-        }
+        })
 
     except Exception as e:
         logger.error(f"Current weather data 조회 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"실시간 날씨 데이터 조회 중 오류가 발생했습니다: {str(e)}")
 
 
-@router.post("/update-empty-data")
-async def update_empty_weather_data(
-    db: Session = Depends(get_db)
-):
+def _update_empty_weather_data_in_session() -> dict[str, Any]:
+    """요청 세션과 별도의 세션으로 빈 데이터 업데이트 실행"""
+    with SessionLocal() as db:
+        # 트랜잭션 잠금은 _update_empty_weather_data 의 commit/rollback 시 해제됩니다.
+        if not db.execute(_EMPTY_DATA_LOCK_SQL).scalar():
+            raise HTTPException(status_code=409, detail="빈 데이터 업데이트 작업이 이미 진행 중입니다.")
+        return _update_empty_weather_data(db)
+
+
+async def _run_update_empty_data(job_id: str):
+    """
+    백그라운드에서 빈 날씨 데이터 업데이트를 실행하고 결과를 저장합니다.
+    """
+    job = {
+        "job_id": job_id,
+        "status": "running",
+        "started_at": datetime.now().isoformat(),
+        "finished_at": None,
+        "result": None,
+        "error": None
+    }
+
+    try:
+        await _update_empty_jobs.save(job_id, job)
+        # DB 작업은 스레드에서 실행하여 이벤트 루프를 막지 않도록 합니다.
+        try:
+            result = await asyncio.to_thread(_update_empty_weather_data_in_session)
+            job.update(status="completed", result=result)
+        except HTTPException as e:
+            job.update(status="failed", error=e.detail)
+        except Exception as e:
+            logger.error(f"Update empty weather data job {job_id} error: {e}", exc_info=True)
+            job.update(status="failed", error=str(e))
+
+        job["finished_at"] = datetime.now().isoformat()
+        await _update_empty_jobs.save(job_id, job)
+    finally:
+        # 요청 처리 시 점유한 실행 잠금 해제 (다른 작업이 점유한 잠금은 유지)
+        await cache_delete_if_equal(_UPDATE_EMPTY_LOCK_KEY, job_id.encode())
+
+
+@router.post("/update-empty-data", status_code=202)
+async def update_empty_weather_data(background_tasks: BackgroundTasks):
     """
-    빈 날씨 데이터를 api_raw_data에서 업데이트
+    빈 날씨 데이터를 api_raw_data에서 업데이트하는 작업을 백그라운드로 시작
     
     weather_current 테이블의 빈 필드(precipitation, visibility, uv_index 등)를
     api_raw_data 테이블에 저장된 이전 수집 데이터를 사용하여 업데이트합니다.
+    진행 상황과 결과는 /update-empty-data/status/{job_id} 엔드포인트로 확인합니다.
+    다른 워커를 포함해 이미 실행 중인 작업이 있으면 409,
+    작업 상태 저장소(Redis)를 사용할 수 없으면 503을 반환합니다.
     """
-    import json
-    from datetime import datetime
-    
+    # 202 응답 전에 Redis 잠금(SET NX)을 점유하여 모든 워커에서 하나의 작업만 접수되도록 합니다.
+    job_id = uuid4().hex
+    acquired = await cache_set_if_absent(_UPDATE_EMPTY_LOCK_KEY, job_id.encode(), _UPDATE_EMPTY_LOCK_TTL)
+    if acquired is None:
+        raise HTTPException(status_code=503, detail="작업 상태 저장소를 사용할 수 없어 업데이트 작업을 시작할 수 없습니다.")
+    if not acquired:
+        raise HTTPException(status_code=409, detail="빈 데이터 업데이트 작업이 이미 진행 중입니다.")
+
+    if not await _update_empty_jobs.save(job_id, {"job_id": job_id, "status": "pending"}):
+        _update_empty_jobs.discard(job_id)
+        await cache_delete_if_equal(_UPDATE_EMPTY_LOCK_KEY, job_id.encode())
+        raise HTTPException(status_code=503, detail="작업 상태 저장소를 사용할 수 없어 업데이트 작업을 시작할 수 없습니다.")
+    background_tasks.add_task(_run_update_empty_data, job_id)
+    return {"status": "accepted", "job_id": job_id}
+
+
+@router.get("/update-empty-data/status/{job_id}")
+async def get_update_empty_data_status(job_id: str):
+    """
+    빈 날씨 데이터 업데이트 작업 상태 조회
+    """
+    job = await _update_empty_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="빈 데이터 업데이트 작업 정보를 찾을 수 없습니다.")
+    return Response(content=job, media_type="application/json")
+
+
+def _get_empty_data_update_sql(db: Session):
+    """weather_current 실제 컬럼 타입으로 일괄 업데이트 문 구성"""
+    global _empty_data_update_sql
+    if _empty_data_update_sql is None:
+        column_types = dict(db.execute(_EMPTY_DATA_COLUMN_TYPES_SQL, {"columns": list(_EMPTY_DATA_COLUMNS)}).all())
+        missing = [column for column in _EMPTY_DATA_COLUMNS if column not in column_types]
+        if missing:
+            raise RuntimeError(f"weather_current 테이블에 컬럼이 없습니다: {', '.join(missing)}")
+        _empty_data_update_sql = text(_EMPTY_DATA_UPDATE_SQL_TEMPLATE.format(**column_types))
+    return _empty_data_update_sql
+
+
+def _bulk_update_empty_weather_data(db: Session, updates: list[dict[str, Any]]) -> tuple[int, Any]:
+    """
+    빈 필드 업데이트를 한 번의 UPDATE ... FROM jsonb_to_recordset() 으로 실행하고 (업데이트 수, 업데이트 후 상태) 반환
+    """
+    if not updates:
+        return 0, db.execute(_EMPTY_DATA_STATUS_SQL).fetchone()
+
+    status = db.execute(
+        _get_empty_data_update_sql(db),
+        {"patches": orjson.dumps(updates).decode()},
+    ).fetchone()
+    return status.updated_count, status
+
+
+def _update_empty_weather_data(db: Session):
     try:
         # 빈 필드가 있는 레코드 조회
-        empty_records_query = text("""
-            SELECT id, region_code, region_name, weather_date, 
-                   avg_temp, max_temp, min_temp, humidity, 
-                   precipitation, wind_speed, weather_condition,
-                   visibility, uv_index
-            FROM weather_current
-            WHERE precipitation IS NULL
-               OR visibility IS NULL
-               OR uv_index IS NULL
-            ORDER BY weather_date DESC, region_code
-            LIMIT 100
-        """)
-        
-        empty_records = db.execute(empty_records_query).fetchall()
+        empty_records = db.execute(_EMPTY_DATA_RECORDS_SQL).fetchall()
         
         if not empty_records:
             return {
@@ -708,36 +1004,24 @@ async def update_empty_weather_data(
                 "updated_count": 0
             }
         
-        updated_count = 0
-        failed_count = 0
-        
+        # 레코드별 (지역명, 날짜) 후보 raw 데이터를 한 번의 쿼리로 조회
+        candidate_keys = list({(record.region_name, record.weather_date) for record in empty_records})
+        raw_data_rows = db.execute(
+            _EMPTY_DATA_RAW_CANDIDATES_SQL,
+            {
+                "region_names": [region_name for region_name, _ in candidate_keys],
+                "weather_dates": [weather_date for _, weather_date in candidate_keys],
+            },
+        ).fetchall()
+
+        raw_data_by_key: dict[tuple[str, Any], list[Any]] = {}
+        for raw_data in raw_data_rows:
+            raw_data_by_key.setdefault((raw_data.region_name, raw_data.weather_date), []).append(raw_data)
+
+        updates = []
+
         for record in empty_records:
-            # api_raw_data에서 해당 날짜와 지역의 데이터 검색
-            raw_data_query = text("""
-                SELECT id, raw_response
-                FROM api_raw_data
-                WHERE api_provider = 'WEATHER'
-                  AND response_status = 200
-                  AND raw_response IS NOT NULL
-                  AND created_at::date = :weather_date
-                  AND (
-                    request_params->>'region' = :region_name
-                    OR request_params->>'city' = :region_name
-                    OR raw_response::text LIKE :region_pattern
-                  )
-                ORDER BY created_at DESC
-                LIMIT 5
-            """)
-            
-            raw_data_results = db.execute(
-                raw_data_query,
-                {
-                    'weather_date': record.weather_date,
-                    'region_name': record.region_name,
-                    'region_pattern': f'%{record.region_name}%'
-                }
-            ).fetchall()
-            
+            raw_data_results = raw_data_by_key.get((record.region_name, record.weather_date))
             if not raw_data_results:
                 continue
                 
@@ -776,54 +1060,21 @@ async def update_empty_weather_data(
                     logger.warning(f"Failed to parse raw_response: {e}")
                     continue
             
-            # 업데이트 수행
+            # 업데이트 대상 수집 (값이 없는 필드는 기존 값 유지)
             if weather_info:
-                update_fields = []
-                params = {'id': record.id}
-                
-                if 'precipitation' in weather_info:
-                    update_fields.append("precipitation = :precipitation")
-                    params['precipitation'] = weather_info['precipitation']
-                    
-                if 'visibility' in weather_info:
-                    update_fields.append("visibility = :visibility")
-                    params['visibility'] = weather_info['visibility']
-                    
-                if 'uv_index' in weather_info:
-                    update_fields.append("uv_index = :uv_index")
-                    params['uv_index'] = weather_info['uv_index']
-                    
-                if api_raw_data_id:
-                    update_fields.append("raw_data_id = :raw_data_id")
-                    params['raw_data_id'] = api_raw_data_id
-                    
-                if update_fields:
-                    update_fields.append("updated_at = :updated_at")
-                    params['updated_at'] = datetime.now()
-                    
-                    update_query = text(f"""
-                        UPDATE weather_current
-                        SET {', '.join(update_fields)}
-                        WHERE id = :id
-                    """)
-                    
-                    db.execute(update_query, params)
-                    updated_count += 1
-                    
+                updates.append({
+                    'id': str(record.id),
+                    'precipitation': weather_info.get('precipitation'),
+                    'visibility': weather_info.get('visibility'),
+                    'uv_index': weather_info.get('uv_index'),
+                    'raw_data_id': api_raw_data_id,
+                })
+
+        # 일괄 업데이트와 업데이트 후 상태 확인
+        updated_count, result = _bulk_update_empty_weather_data(db, updates)
+
         db.commit()
-        
-        # 업데이트 후 상태 확인
-        check_query = text("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN precipitation IS NULL THEN 1 ELSE 0 END) as null_precipitation,
-                SUM(CASE WHEN visibility IS NULL THEN 1 ELSE 0 END) as null_visibility,
-                SUM(CASE WHEN uv_index IS NULL THEN 1 ELSE 0 END) as null_uv_index
-            FROM weather_current
-        """)
-        
-        result = db.execute(check_query).fetchone()
-        
+
         return {
             "success": True,
             "message": "빈 날씨 데이터 업데이트가 완료되었습니다.",
@@ -2,18 +2,21 @@
 WebSocket API for real-time batch job logs streaming
 """
 
+import asyncio
 import json
 import logging
+import secrets
 from datetime import datetime
-from typing import Dict, Set
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+import orjson
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from psycopg2 import sql
+from sqlalchemy.orm import selectinload
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionLocal, engine
 from app.models_batch_execution import BatchJobExecution
-from app.models import BatchJobLog
 
 logger = logging.getLogger(__name__)
 
@@ -25,37 +28,299 @@ router = APIRouter(
 # 활성 WebSocket 연결 관리
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # 작업당 연결 수가 적으므로 set 대신 list로 관리
+        self.active_connections: Dict[str, List[WebSocket]] = {}
         
     async def connect(self, websocket: WebSocket, job_id: str):
         await websocket.accept()
-        if job_id not in self.active_connections:
-            self.active_connections[job_id] = set()
-        self.active_connections[job_id].add(websocket)
+        connections = self.active_connections.setdefault(job_id, [])
+        if websocket not in connections:
+            connections.append(websocket)
         logger.info(f"WebSocket connected for job {job_id}")
         
+    def _remove(self, websocket: WebSocket, job_id: str):
+        connections = self.active_connections.get(job_id)
+        if connections is None:
+            return
+        try:
+            connections.remove(websocket)
+        except ValueError:
+            pass
+        if not connections:
+            del self.active_connections[job_id]
+
     def disconnect(self, websocket: WebSocket, job_id: str):
-        if job_id in self.active_connections:
-            self.active_connections[job_id].discard(websocket)
-            if not self.active_connections[job_id]:
-                del self.active_connections[job_id]
+        self._remove(websocket, job_id)
         logger.info(f"WebSocket disconnected for job {job_id}")
         
     async def send_to_job(self, job_id: str, message: dict):
-        if job_id in self.active_connections:
-            disconnected = set()
-            for connection in self.active_connections[job_id]:
+        # 전송 중 연결/해제가 일어날 수 있으므로 현재 목록을 복사하여 사용
+        connections = list(self.active_connections.get(job_id, ()))
+        if not connections:
+            return
+
+        # 메시지는 한 번만 직렬화하고 모든 연결에 동시에 전송
+        payload = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+
+        # 실패한 연결 제거
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending message to websocket: {result}")
+                self._remove(connection, job_id)
+
+manager = ConnectionManager()
+
+
+# 작업 상태 변경 알림 채널 접두사
+# (batch_job_executions 트리거가 NOTIFY "job_<작업 ID>", '<상태 JSON>' 으로 발행,
+#  migrations/batch_job_status_notify.sql 참고)
+JOB_CHANNEL_PREFIX = "job_"
+
+# 알림이 없을 때 작업 상태를 다시 확인하는 주기 (초)
+JOB_STATUS_FALLBACK_INTERVAL = 30
+
+# 알림 연결이 끊겼을 때 재연결 대기 시간 (초, 실패할 때마다 두 배로 늘려 최대값까지)
+RECONNECT_INITIAL_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+
+# 클라이언트가 현재 상태를 요청했음을 나타내는 큐 항목
+_STATUS_REQUEST = object()
+
+# 데이터베이스에서 최신 상태를 다시 확인해야 함을 나타내는 큐 항목
+# (알림 대기 시간 초과, 또는 알림 연결이 재연결되어 그 사이 알림을 놓쳤을 수 있는 경우)
+_REFRESH = object()
+
+
+class JobNotificationListener:
+    """
+    PostgreSQL LISTEN/NOTIFY 로 작업 상태 변경 알림 수신
+
+    애플리케이션 전체에서 풀 밖의 전용 psycopg2 연결 하나만 사용합니다.
+    연결 소켓을 이벤트 루프에 등록(add_reader)하여 폴링 없이 알림이 도착했을 때만
+    해당 채널(job_<작업 ID>)을 구독 중인 WebSocket 별 큐에 payload를 전달합니다.
+    채널은 첫 구독 시 LISTEN, 마지막 구독 해제 시 UNLISTEN 합니다.
+    연결이 끊기면 백오프 간격으로 재연결하여 구독 중인 채널을 다시 LISTEN 하고,
+    재연결 전까지 구독 중인 WebSocket 은 주기적 상태 확인으로 동작합니다.
+    """
+
+    def __init__(self):
+        self._connection = None
+        self._fileno: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = asyncio.Lock()
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._reconnect_task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        return self._connection is not None
+
+    def _connect(self):
+        connection = engine.raw_connection()
+        connection.detach()  # LISTEN 상태의 연결이 풀로 반환되지 않도록 분리
+        connection.dbapi_connection.autocommit = True
+        return connection
+
+    def _execute(self, statement: str, channel: str):
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(sql.SQL(statement).format(sql.Identifier(channel)))
+        finally:
+            cursor.close()
+
+    async def _open(self):
+        connection = await asyncio.to_thread(self._connect)
+        self._loop = asyncio.get_running_loop()
+        self._connection = connection
+        # 연결이 끊긴 뒤에는 fileno()를 조회할 수 없으므로 등록한 소켓 번호를 보관
+        self._fileno = connection.dbapi_connection.fileno()
+        self._loop.add_reader(self._fileno, self._on_readable)
+
+    async def start(self):
+        """애플리케이션 시작 시 공용 알림 연결 생성 (실패하면 백그라운드에서 재연결)"""
+        self._closed = False
+        if self._connection is not None or self._reconnect_task is not None:
+            return
+        try:
+            await self._open()
+        except Exception as e:
+            logger.warning(f"Job notification connection failed, retrying in background: {e}")
+            self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        if self._closed or self._reconnect_task is not None:
+            return
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = RECONNECT_INITIAL_DELAY
+        try:
+            while True:
+                await asyncio.sleep(delay)
                 try:
-                    await connection.send_json(message)
+                    async with self._lock:
+                        await self._open()
+                        for channel in self._subscribers:
+                            await asyncio.to_thread(self._execute, "LISTEN {}", channel)
+                    break
                 except Exception as e:
-                    logger.error(f"Error sending message to websocket: {e}")
-                    disconnected.add(connection)
-            
-            # 실패한 연결 제거
-            for conn in disconnected:
-                self.active_connections[job_id].discard(conn)
+                    self._disconnect()
+                    delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                    logger.warning(f"Job notification reconnect failed, retrying in {delay}s: {e}")
+        finally:
+            self._reconnect_task = None
 
-manager = ConnectionManager()
+        logger.info("Job notification connection restored")
+        # 연결이 끊긴 동안 놓친 알림이 있을 수 있으므로 구독 중인 WebSocket 이 최신 상태를 다시 확인
+        for queues in self._subscribers.values():
+            for queue in queues:
+                queue.put_nowait(_REFRESH)
+
+    def _dispatch(self):
+        dbapi_connection = self._connection.dbapi_connection
+        while dbapi_connection.notifies:
+            notify = dbapi_connection.notifies.pop(0)
+            for queue in self._subscribers.get(notify.channel, ()):
+                queue.put_nowait(notify.payload)
+
+    def _on_readable(self):
+        try:
+            self._connection.dbapi_connection.poll()
+        except Exception as e:
+            # 재연결 전까지 구독 중인 WebSocket 은 주기적 상태 확인으로 동작
+            logger.error(f"Job notification connection error, reconnecting: {e}")
+            self._disconnect()
+            self._schedule_reconnect()
+            return
+        self._dispatch()
+
+    async def subscribe(self, job_id: str) -> asyncio.Queue:
+        """작업 채널 구독 (알림 연결을 사용할 수 없어도 큐는 반환)"""
+        channel = f"{JOB_CHANNEL_PREFIX}{job_id}"
+        queue: asyncio.Queue = asyncio.Queue()
+        async with self._lock:
+            queues = self._subscribers.setdefault(channel, [])
+            queues.append(queue)
+            if len(queues) == 1 and self.available:
+                try:
+                    await asyncio.to_thread(self._execute, "LISTEN {}", channel)
+                    self._dispatch()
+                except Exception as e:
+                    logger.warning(f"Job notification LISTEN failed, falling back to periodic refresh: {e}")
+        return queue
+
+    async def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        """작업 채널 구독 해제 (마지막 구독자면 UNLISTEN)"""
+        channel = f"{JOB_CHANNEL_PREFIX}{job_id}"
+        async with self._lock:
+            queues = self._subscribers.get(channel)
+            if queues is None:
+                return
+            try:
+                queues.remove(queue)
+            except ValueError:
+                pass
+            if queues:
+                return
+            del self._subscribers[channel]
+            if self.available:
+                try:
+                    await asyncio.to_thread(self._execute, "UNLISTEN {}", channel)
+                except Exception as e:
+                    logger.warning(f"Job notification UNLISTEN failed: {e}")
+
+    def _disconnect(self):
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        fileno, self._fileno = self._fileno, None
+        try:
+            if self._loop is not None and fileno is not None:
+                self._loop.remove_reader(fileno)
+        except Exception:
+            pass
+        finally:
+            # 풀에서 분리된 연결이므로 풀의 reset(rollback) 없이 DBAPI 연결을 직접 닫음
+            try:
+                connection.dbapi_connection.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """애플리케이션 종료 시 재연결을 중단하고 공용 알림 연결 정리"""
+        self._closed = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._disconnect()
+
+
+job_notification_listener = JobNotificationListener()
+
+
+def _job_status(job: BatchJobExecution) -> dict:
+    """작업 상태 메시지 데이터 구성"""
+    return {
+        "status": job.status if job.status else "UNKNOWN",
+        "progress": float(job.progress) if job.progress else 0.0,
+        "current_step": job.current_step,
+        "total_steps": job.total_steps
+    }
+
+
+def _load_job_status(job_id: str) -> dict | None:
+    """짧은 세션으로 작업의 최신 상태 조회 (작업이 없으면 None)"""
+    with SessionLocal() as db:
+        job = db.query(BatchJobExecution).filter(BatchJobExecution.id == job_id).first()
+        return _job_status(job) if job else None
+
+
+def _job_update_message(status: dict) -> str:
+    """job_update 메시지를 orjson으로 한 번만 직렬화"""
+    return orjson.dumps({"type": "job_update", "data": status}).decode()
+
+
+def _parse_job_notification(payload: str) -> dict | None:
+    """NOTIFY payload(JSON)에서 작업 상태 변경 내용 추출 (형식이 맞지 않으면 None)"""
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    changes = {key: data[key] for key in ("status", "progress", "current_step", "total_steps") if key in data}
+    # _job_status 와 같은 형식으로 맞춤
+    if "status" in changes:
+        changes["status"] = changes["status"] or "UNKNOWN"
+    if "progress" in changes:
+        changes["progress"] = float(changes["progress"]) if changes["progress"] else 0.0
+    return changes or None
+
+
+async def _receive_client_messages(websocket: WebSocket, queue: asyncio.Queue):
+    """
+    클라이언트 메시지 처리 (ping 은 바로 pong 응답, 그 외 메시지는 현재 상태 전송 요청)
+
+    연결이 끊기면 큐에 None을 넣어 상태 전송 루프를 종료시킵니다.
+    """
+    try:
+        while True:
+            data = await websocket.receive_text()
+            if data == "ping":
+                await websocket.send_text("pong")
+            else:
+                queue.put_nowait(_STATUS_REQUEST)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"WebSocket error: {e}")
+    finally:
+        queue.put_nowait(None)
 
 
 @router.websocket("/jobs/{job_id}/logs/stream")
@@ -63,27 +328,66 @@ async def websocket_endpoint(
     websocket: WebSocket,
     job_id: str,
     api_key: str = Query(...),
-    db: Session = Depends(get_db),
+    log_batch: bool = Query(False, description="기존 로그를 log_batch 메시지 하나로 전송"),
 ):
     """
     WebSocket endpoint for streaming batch job logs in real-time.
     
     - **job_id**: 배치 작업 ID
     - **api_key**: API 인증 키 (쿼리 파라미터로 전달)
+    - **log_batch**: true 이면 기존 로그를 로그마다가 아닌 하나의 log_batch 메시지로 전송 (기본값 false)
+
+    서버 → 클라이언트 메시지:
+    - 기존 로그 (log_batch=false): 로그마다
+      `{"type": "log", "timestamp", "level", "message", "details", "historical": true}`
+    - 기존 로그 (log_batch=true): 한 번
+      `{"type": "log_batch", "logs": [{"timestamp", "level", "message", "details"}, ...], "historical": true}`
+      (기존 로그가 없으면 전송하지 않음)
+    - 작업 상태: `{"type": "job_update", "data": {"status", "progress", "current_step", "total_steps"}}`
+    - 작업이 없을 때: `{"type": "error", "message"}` 후 연결 종료
+
+    클라이언트 → 서버 메시지: "ping" 은 "pong" 으로 응답, 그 외 메시지는 현재 작업 상태(job_update) 요청
     """
     # 간단한 API 키 검증 (실제로는 더 복잡한 인증 필요)
-    if api_key != "batch-api-secret-key":
+    # 데이터베이스 연결을 사용하기 전에 상수 시간 비교로 먼저 거부
+    if not secrets.compare_digest(api_key.encode(), settings.batch_api_key.encode()):
         await websocket.close(code=4001, reason="Invalid API key")
         return
     
     await manager.connect(websocket, job_id)
+    queue = None
+    receiver = None
     
     try:
-        # 데이터베이스에서 직접 작업 정보 조회
-        job = db.query(BatchJobExecution).filter(
-            BatchJobExecution.id == job_id
-        ).first()
-        
+        # 초기 데이터는 짧은 세션으로 조회하고 연결 유지 중에는 세션을 점유하지 않음
+        # (기존 로그는 selectinload로 함께 로드)
+        logs = []
+        with SessionLocal() as db:
+            job = db.query(BatchJobExecution).options(
+                selectinload(BatchJobExecution.logs)
+            ).filter(
+                BatchJobExecution.id == job_id
+            ).first()
+
+            if job:
+                status = _job_status(job)
+                now = datetime.now()
+                logs = [
+                    {
+                        "timestamp": log.start_time or now,
+                        "level": "ERROR" if log.status == "failed" else "INFO",
+                        "message": log.error_message or f"{log.job_name} - {log.status}",
+                        "details": {
+                            "status": log.status,
+                            "job_name": log.job_name,
+                            "job_type": log.job_type,
+                            "duration": log.duration,
+                            "result": log.result
+                        }
+                    }
+                    for log in job.logs
+                ]
+
         if not job:
             await websocket.send_json({
                 "type": "error",
@@ -94,82 +398,92 @@ async def websocket_endpoint(
         
         # 기존 로그 전송 (historical logs)
         try:
-            existing_logs = db.query(BatchJobLog).filter(
-                BatchJobLog.job_id == job_id
-            ).order_by(BatchJobLog.start_time).all()
-            
-            for log in existing_logs:
-                await websocket.send_json({
-                    "type": "log",
-                    "timestamp": log.start_time.isoformat() if log.start_time else datetime.now().isoformat(),
-                    "level": "ERROR" if log.status == "failed" else "INFO",
-                    "message": log.error_message or f"{log.job_name} - {log.status}",
-                    "details": {
-                        "status": log.status,
-                        "job_name": log.job_name,
-                        "job_type": log.job_type,
-                        "duration": log.duration,
-                        "result": log.result
-                    },
-                    "historical": True
-                })
+            if log_batch:
+                # 로그마다 프레임을 보내지 않고 하나의 log_batch 메시지로 전송
+                if logs:
+                    await websocket.send_text(orjson.dumps({
+                        "type": "log_batch",
+                        "logs": logs,
+                        "historical": True
+                    }).decode())
+            else:
+                # 기존 클라이언트 호환: 로그마다 log 메시지 전송
+                for log in logs:
+                    await websocket.send_text(orjson.dumps({
+                        "type": "log",
+                        **log,
+                        "historical": True
+                    }).decode())
         except Exception as e:
             logger.error(f"Error fetching historical logs: {e}")
         
         # 작업 상태 정보 전송
+        last_sent_status = status
         try:
-            await websocket.send_json({
-                "type": "job_update",
-                "data": {
-                    "status": job.status if job.status else "UNKNOWN",
-                    "progress": float(job.progress) if job.progress else 0.0,
-                    "current_step": job.current_step,
-                    "total_steps": job.total_steps
-                }
-            })
+            await websocket.send_text(_job_update_message(status))
         except Exception as e:
             logger.error(f"Error sending job status: {e}")
-        
-        # 실시간 업데이트 대기
+
+        # 작업 상태 변경 알림 구독 (공용 알림 연결이 없으면 주기적 상태 확인만 수행)
+        queue = await job_notification_listener.subscribe(job_id)
+
+        receiver = asyncio.create_task(_receive_client_messages(websocket, queue))
+
+        # 실시간 업데이트 대기: 알림이 오면 즉시, 알림이 없으면 일정 주기마다 상태 전송
         while True:
             try:
-                # 클라이언트로부터 메시지 수신
-                data = await websocket.receive_text()
-                
-                # ping-pong 처리
-                if data == "ping":
-                    await websocket.send_text("pong")
-                    continue
-                
-                # 주기적으로 작업 상태 업데이트
-                # 데이터베이스에서 최신 상태 조회
-                try:
-                    # 새로고침된 작업 정보 가져오기
-                    db.refresh(job)
-                    
-                    # 최신 로그 가져오기 (마지막으로 전송한 이후의 로그만)
-                    # 실제 구현에서는 마지막 전송 시간을 추적해야 함
-                    
-                    await websocket.send_json({
-                        "type": "job_update",
-                        "data": {
-                            "status": job.status if job.status else "UNKNOWN",
-                            "progress": float(job.progress) if job.progress else 0.0,
-                            "current_step": job.current_step,
-                            "total_steps": job.total_steps
-                        }
-                    })
-                except Exception as e:
-                    logger.error(f"Error updating job status: {e}")
-                    
-            except WebSocketDisconnect:
-                manager.disconnect(websocket, job_id)
-                break
+                item = await asyncio.wait_for(queue.get(), timeout=JOB_STATUS_FALLBACK_INTERVAL)
+            except asyncio.TimeoutError:
+                item = _REFRESH
+
+            # 그 사이 쌓인 알림/요청을 모두 꺼내 하나의 job_update 로 합쳐서 전송
+            items = [item]
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            closed = None in items
+
+            try:
+                requested = False
+                needs_refresh = False
+                for item in items:
+                    if item is None:
+                        continue
+                    if item is _STATUS_REQUEST:
+                        # 클라이언트 요청에는 알림 누락 여부와 관계없이 항상 최신 상태 조회
+                        requested = True
+                        needs_refresh = True
+                        continue
+                    if item is _REFRESH:
+                        needs_refresh = True
+                        continue
+                    changes = _parse_job_notification(item)
+                    if changes is not None:
+                        status = {**status, **changes}
+                    else:
+                        needs_refresh = True
+
+                if needs_refresh:
+                    # 클라이언트 요청, 상태 정보가 없는 알림, 주기적 확인 또는 알림 재연결: 데이터베이스에서 최신 상태 조회
+                    status = await asyncio.to_thread(_load_job_status, job_id) or status
+
+                # 알림/주기적 확인 결과가 마지막으로 보낸 상태와 같으면 전송 생략
+                # (클라이언트의 명시적 요청에는 항상 응답)
+                if not closed and (requested or status != last_sent_status):
+                    await websocket.send_text(_job_update_message(status))
+                    last_sent_status = status
             except Exception as e:
-                logger.error(f"WebSocket error: {e}")
+                logger.error(f"Error updating job status: {e}")
+
+            if closed:
                 break
-                
+
+        await receiver
+
     except Exception as e:
         logger.error(f"WebSocket connection error: {e}")
     finally:
+        if receiver is not None and not receiver.done():
+            receiver.cancel()
+        if queue is not None:
+            await job_notification_listener.unsubscribe(job_id, queue)
         manager.disconnect(websocket, job_id)
\ No newline at end of file
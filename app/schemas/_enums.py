@@ -0,0 +1,13 @@
+"""
+스키마와 ORM 모델이 함께 사용하는 Enum 정의
+SQLAlchemy 에 의존하지 않으므로 스키마 모듈이 ORM 모델 모듈을 불러오지 않아도 됩니다.
+"""
+
+import enum
+
+
+class UserRole(str, enum.Enum):
+    """사용자 역할"""
+
+    USER = "USER"
+    ADMIN = "ADMIN"
@@ -1,9 +1,8 @@
 import enum
 from datetime import datetime
-from typing import Any
 
 from pydantic import BaseModel, ConfigDict, EmailStr, computed_field, field_validator
-from ..validators import CommonValidators
+from ..validators import UserPreferences, ValidatedEmail
 
 
 class AdminStatus(enum.Enum):
@@ -17,25 +16,14 @@ class AdminStatus(enum.Enum):
 class AdminBase(BaseModel):
     """관리자 기본 정보"""
 
-    email: str
+    email: ValidatedEmail
     nickname: str
     profile_image: str | None = None
-    preferences: dict[str, Any] | None = None
+    preferences: UserPreferences = None
     preferred_region: str | None = None
     preferred_theme: str | None = None
     bio: str | None = None
 
-    @field_validator("preferences", mode="before")
-    @classmethod
-    def validate_preferences(cls, v):
-        """preferences 필드 검증 - 빈 배열이나 None을 빈 딕셔너리로 변환"""
-        return CommonValidators.validate_preferences(v)
-
-    @field_validator("email", mode="before")
-    @classmethod
-    def validate_email(cls, v):
-        return CommonValidators.validate_email(v)
-
 
 class AdminCreate(BaseModel):
     email: EmailStr
@@ -51,12 +39,18 @@ class AdminResponse(BaseModel):
     email: str
     name: str | None
     phone: str | None
-    status: AdminStatus
+    status: AdminStatus | None  # admins.status 컬럼은 NULL 을 허용
     is_superuser: bool = False  # 데이터베이스 필드로부터 직접 가져옴
     last_login_at: datetime | None
     created_at: datetime
     role_ids: list[int] = []  # 관리자가 가진 역할 ID 목록
 
+    @field_validator("status", mode="before")
+    @classmethod
+    def validate_status(cls, v):
+        """ORM 모델의 AdminStatus(models_admin) 값을 그대로 받을 수 있도록 값으로 변환"""
+        return v.value if isinstance(v, enum.Enum) else v
+
     @computed_field
     @property
     def username(self) -> str:
@@ -73,7 +67,7 @@ class AdminResponse(BaseModel):
     @property
     def is_active(self) -> bool:
         """프론트엔드 호환을 위한 is_active 필드"""
-        # use_enum_values=True로 인해 status가 문자열로 변환되므로 문자열 비교
+        # use_enum_values=True로 인해 status가 문자열로 변환되므로 문자열 비교 (NULL 이면 비활성)
         return self.status == "ACTIVE"
 
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
@@ -6,7 +6,7 @@
 from datetime import datetime
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
@@ -46,12 +46,6 @@ class BaseResponse(BaseModel, Generic[T]):
     meta: MetaInfo | None = Field(None, description="메타 정보")
     timestamp: datetime = Field(default_factory=datetime.now, description="응답 시간")
 
-    model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: v.isoformat()
-        }
-    )
-
 
 class SuccessResponse(BaseResponse[T], Generic[T]):
     """성공 응답 헬퍼"""
@@ -94,7 +88,7 @@ class PaginatedResponse(SuccessResponse[list[T]], Generic[T]):
         message: str = "목록을 성공적으로 조회했습니다.",
         **kwargs
     ):
-        total_pages = (total + size - 1) // size if size > 0 else 0
+        total_pages = -(-total // size) if size > 0 else 0
         meta = MetaInfo(
             total=total,
             page=page,
@@ -2,36 +2,18 @@
 문의사항 관련 스키마 정의
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, validator, ConfigDict
+from typing import Literal, Optional
+from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
 
 class ContactBase(BaseModel):
     """문의사항 기본 스키마"""
-    category: str
-    title: str
+    category: str = Field(..., max_length=50)
+    title: str = Field(..., max_length=200)
     content: str
-    name: str
+    name: str = Field(..., max_length=50)
     email: EmailStr
     is_private: bool = False
-    
-    @validator('category')
-    def validate_category(cls, v):
-        if len(v) > 50:
-            raise ValueError('Category must be 50 characters or less')
-        return v
-    
-    @validator('title')
-    def validate_title(cls, v):
-        if len(v) > 200:
-            raise ValueError('Title must be 200 characters or less')
-        return v
-    
-    @validator('name')
-    def validate_name(cls, v):
-        if len(v) > 50:
-            raise ValueError('Name must be 50 characters or less')
-        return v
 
 
 class ContactListResponse(BaseModel):
@@ -50,23 +32,6 @@ class ContactListResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ContactDetailResponse(BaseModel):
-    """문의 상세 응답 스키마"""
-    id: int
-    category: str
-    title: str
-    content: str
-    name: str
-    email: str
-    approval_status: str
-    views: int
-    created_at: datetime
-    is_private: bool
-    answer: Optional['ContactAnswerResponse'] = None
-    
-    model_config = ConfigDict(from_attributes=True)
-
-
 class ContactAnswerBase(BaseModel):
     """문의 답변 기본 스키마"""
     content: str
@@ -94,16 +59,26 @@ class ContactAnswerResponse(ContactAnswerBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class ContactStatusUpdate(BaseModel):
-    """문의 상태 변경 스키마"""
+class ContactDetailResponse(BaseModel):
+    """문의 상세 응답 스키마"""
+    id: int
+    category: str
+    title: str
+    content: str
+    name: str
+    email: str
     approval_status: str
+    views: int
+    created_at: datetime
+    is_private: bool
+    answer: Optional[ContactAnswerResponse] = None
     
-    @validator('approval_status')
-    def validate_status(cls, v):
-        allowed_statuses = ['PENDING', 'PROCESSING', 'COMPLETE']
-        if v not in allowed_statuses:
-            raise ValueError(f'Status must be one of {allowed_statuses}')
-        return v
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ContactStatusUpdate(BaseModel):
+    """문의 상태 변경 스키마"""
+    approval_status: Literal['PENDING', 'PROCESSING', 'COMPLETE']
 
 
 class ContactStatsResponse(BaseModel):
@@ -115,7 +90,3 @@ class ContactStatsResponse(BaseModel):
     today_count: int
     this_week_count: int
     this_month_count: int
-
-
-# Forward reference 해결
-ContactDetailResponse.model_rebuild()
\ No newline at end of file
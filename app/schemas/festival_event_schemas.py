@@ -1,7 +1,7 @@
 """축제/행사 스키마"""
 from datetime import date, datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 
 
@@ -95,11 +95,4 @@ class FestivalEventResponse(FestivalEventBase):
     updated_at: datetime
     last_sync_at: Optional[datetime] = None
     
-    @field_validator('raw_data_id', mode='before')
-    @classmethod
-    def convert_uuid_to_string(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-    
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -6,24 +6,6 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict
 
 
-class LeisureSportBase(BaseModel):
-    """레저/스포츠 시설 기본 스키마"""
-
-    content_id: str
-    region_code: str
-    facility_name: str
-    sports_type: str | None = None
-    category_code: str | None = None
-    address: str | None = None
-    zipcode: str | None = None
-    latitude: float | None = None
-    longitude: float | None = None
-    tel: str | None = None
-    homepage: str | None = None
-    operationg_hours: dict | None | None = None
-    reservation_info: dict | None = None
-
-
 class LeisureSportCreate(BaseModel):
     region_code: str
     facility_name: str
@@ -3,7 +3,7 @@
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from uuid import UUID
 
@@ -33,26 +33,14 @@ class RegionUpdateRequest(BaseModel):
     """지역 정보 업데이트 요청 스키마"""
     region_name: Optional[str] = Field(None, max_length=100)
     region_name_full: Optional[str] = Field(None, max_length=200)
-    latitude: Optional[float] = Field(None, ge=-90, le=90)
-    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    latitude: Optional[float] = Field(None, ge=33.0, le=38.6, description="위도 (한국 영역)")
+    longitude: Optional[float] = Field(None, ge=124.6, le=131.9, description="경도 (한국 영역)")
     grid_x: Optional[int] = Field(None, ge=1, le=200)
     grid_y: Optional[int] = Field(None, ge=1, le=200)
     is_active: Optional[bool] = None
     api_mappings: Optional[Dict[str, Any]] = None
     coordinate_info: Optional[Dict[str, Any]] = None
 
-    @validator('latitude')
-    def validate_latitude_korea(cls, v):
-        if v is not None and not (33.0 <= v <= 38.6):
-            raise ValueError('위도는 한국 영역 내에 있어야 합니다 (33.0 ~ 38.6)')
-        return v
-
-    @validator('longitude')
-    def validate_longitude_korea(cls, v):
-        if v is not None and not (124.6 <= v <= 131.9):
-            raise ValueError('경도는 한국 영역 내에 있어야 합니다 (124.6 ~ 131.9)')
-        return v
-
 
 class RegionCreateRequest(BaseModel):
     """지역 정보 생성 요청 스키마"""
@@ -61,26 +49,14 @@ class RegionCreateRequest(BaseModel):
     region_name_full: Optional[str] = Field(None, max_length=200)
     parent_region_code: Optional[str] = Field(None, max_length=20)
     region_level: int = Field(..., ge=1, le=2)
-    latitude: Optional[float] = Field(None, ge=-90, le=90)
-    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    latitude: Optional[float] = Field(None, ge=33.0, le=38.6, description="위도 (한국 영역)")
+    longitude: Optional[float] = Field(None, ge=124.6, le=131.9, description="경도 (한국 영역)")
     grid_x: Optional[int] = Field(None, ge=1, le=200)
     grid_y: Optional[int] = Field(None, ge=1, le=200)
     is_active: bool = True
     api_mappings: Optional[Dict[str, Any]] = None
     coordinate_info: Optional[Dict[str, Any]] = None
 
-    @validator('latitude')
-    def validate_latitude_korea(cls, v):
-        if v is not None and not (33.0 <= v <= 38.6):
-            raise ValueError('위도는 한국 영역 내에 있어야 합니다 (33.0 ~ 38.6)')
-        return v
-
-    @validator('longitude')
-    def validate_longitude_korea(cls, v):
-        if v is not None and not (124.6 <= v <= 131.9):
-            raise ValueError('경도는 한국 영역 내에 있어야 합니다 (124.6 ~ 131.9)')
-        return v
-
 
 class RegionStatsResponse(BaseModel):
     """지역 통계 응답 스키마"""
@@ -100,23 +76,11 @@ class RegionStatsResponse(BaseModel):
 class CoordinateUpdateRequest(BaseModel):
     """좌표 정보 업데이트 요청 스키마"""
     region_code: str
-    latitude: Optional[float] = Field(None, ge=-90, le=90)
-    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    latitude: Optional[float] = Field(None, ge=33.0, le=38.6, description="위도 (한국 영역)")
+    longitude: Optional[float] = Field(None, ge=124.6, le=131.9, description="경도 (한국 영역)")
     grid_x: Optional[int] = Field(None, ge=1, le=200)
     grid_y: Optional[int] = Field(None, ge=1, le=200)
 
-    @validator('latitude')
-    def validate_latitude_korea(cls, v):
-        if v is not None and not (33.0 <= v <= 38.6):
-            raise ValueError('위도는 한국 영역 내에 있어야 합니다 (33.0 ~ 38.6)')
-        return v
-
-    @validator('longitude')
-    def validate_longitude_korea(cls, v):
-        if v is not None and not (124.6 <= v <= 131.9):
-            raise ValueError('경도는 한국 영역 내에 있어야 합니다 (124.6 ~ 131.9)')
-        return v
-
 
 class RegionSearchRequest(BaseModel):
     """지역 검색 요청 스키마"""
@@ -183,7 +147,3 @@ class CoordinateValidationResponse(BaseModel):
     """좌표 유효성 검증 응답 스키마"""
     validation_results: list[CoordinateValidationResult]
     summary: CoordinateValidationSummary
-
-
-# 순환 참조 해결을 위한 모델 업데이트
-RegionHierarchyNode.update_forward_refs()
\ No newline at end of file
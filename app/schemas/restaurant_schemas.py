@@ -10,6 +10,8 @@ from pydantic import BaseModel, Field, ConfigDict
 class RestaurantBase(BaseModel):
     """음식점 기본 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     restaurant_name: str = Field(..., description="음식점명")
     region_code: str = Field(..., description="지역 코드")
     category_code: str | None = Field(None, description="대분류 코드")
@@ -34,15 +36,15 @@ class RestaurantBase(BaseModel):
     overview: str | None = Field(None, description="개요")
 
 
-class RestaurantCreate(RestaurantBase):
-    """음식점 생성 스키마"""
-
-    pass
+# 음식점 생성 스키마 (기본 스키마와 필드가 같아 별칭으로 재사용)
+RestaurantCreate = RestaurantBase
 
 
 class RestaurantUpdate(BaseModel):
     """음식점 수정 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     restaurant_name: str | None = None
     category_code: str | None = None
     sub_category_code: str | None = None
@@ -73,12 +75,14 @@ class RestaurantResponse(RestaurantBase):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class RestaurantListResponse(BaseModel):
     """음식점 목록 응답 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     items: list[RestaurantResponse]
     total: int
     skip: int
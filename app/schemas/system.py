@@ -3,6 +3,7 @@
 """
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -10,13 +11,17 @@ from pydantic import BaseModel, Field, ConfigDict
 class DatabaseStatus(BaseModel):
     """데이터베이스 상태"""
 
-    status: str = Field(..., description="데이터베이스 연결 상태")
+    model_config = ConfigDict(defer_build=True)
+
+    status: Literal["연결됨", "연결실패"] = Field(..., description="데이터베이스 연결 상태")
     response_time: str = Field(..., description="응답 시간")
 
 
 class ExternalApiStatus(BaseModel):
     """외부 API 상태"""
 
+    model_config = ConfigDict(defer_build=True)
+
     status: str = Field(..., description="API 상태")
     response_time: str = Field(..., description="응답 시간")
 
@@ -24,6 +29,8 @@ class ExternalApiStatus(BaseModel):
 class ExternalApisStatus(BaseModel):
     """모든 외부 API 상태"""
 
+    model_config = ConfigDict(defer_build=True)
+
     weather_api: ExternalApiStatus = Field(..., description="날씨 API 상태")
     weather_flick_back: ExternalApiStatus = Field(..., description="Weather Flick 메인 서비스 상태")
     google_places: ExternalApiStatus = Field(..., description="구글 플레이스 API 상태")
@@ -32,7 +39,9 @@ class ExternalApisStatus(BaseModel):
 class SystemStatusData(BaseModel):
     """시스템 상태 데이터"""
 
-    service_status: str = Field(..., description="전체 서비스 상태")
+    model_config = ConfigDict(defer_build=True)
+
+    service_status: Literal["정상", "문제발생"] = Field(..., description="전체 서비스 상태")
     database: DatabaseStatus = Field(..., description="데이터베이스 상태")
     external_apis: ExternalApisStatus = Field(..., description="외부 API 상태")
 
@@ -47,4 +56,4 @@ class SystemLogOut(BaseModel):
     context: dict | None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
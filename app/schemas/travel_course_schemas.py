@@ -9,6 +9,8 @@ from pydantic import BaseModel, ConfigDict
 class TravelCourseBase(BaseModel):
     """여행 코스 기본 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     content_id: str
     region_code: str
     course_name: str
@@ -37,6 +39,8 @@ class TravelCourseBase(BaseModel):
 class TravelCourseCreate(BaseModel):
     """여행 코스 생성 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     region_code: str
     course_name: str
     course_theme: str | None = None
@@ -70,10 +74,8 @@ class TravelCourseCreate(BaseModel):
     processing_status: str | None = None
 
 
-class TravelCourseUpdate(TravelCourseCreate):
-    """여행 코스 수정 스키마"""
-
-    pass
+# 여행 코스 수정 스키마 (생성 스키마와 필드가 같아 별칭으로 재사용)
+TravelCourseUpdate = TravelCourseCreate
 
 
 class TravelCourseResponse(TravelCourseBase):
@@ -86,12 +88,14 @@ class TravelCourseResponse(TravelCourseBase):
     updated_at: datetime
     last_sync_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class TravelCourseListResponse(BaseModel):
     """여행 코스 목록 응답 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     items: list[TravelCourseResponse]
     total: int
 
@@ -99,6 +103,8 @@ class TravelCourseListResponse(BaseModel):
 class TravelCourseSearch(BaseModel):
     """여행 코스 검색 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     region_code: str | None = None
     course_name: str | None = None
     course_theme: str | None = None
@@ -112,6 +118,8 @@ class TravelCourseSearch(BaseModel):
 class TravelCourseSpotBase(BaseModel):
     """여행 코스 구성 지점 기본 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     course_id: str
     spot_content_id: str | None = None
     sequence: int
@@ -129,6 +137,8 @@ class TravelCourseSpotBase(BaseModel):
 class TravelCourseSpotCreate(BaseModel):
     """여행 코스 구성 지점 생성 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     course_id: str
     spot_content_id: str | None = None
     sequence: int
@@ -143,10 +153,8 @@ class TravelCourseSpotCreate(BaseModel):
     tips: str | None = None
 
 
-class TravelCourseSpotUpdate(TravelCourseSpotCreate):
-    """여행 코스 구성 지점 수정 스키마"""
-
-    pass
+# 여행 코스 구성 지점 수정 스키마 (생성 스키마와 필드가 같아 별칭으로 재사용)
+TravelCourseSpotUpdate = TravelCourseSpotCreate
 
 
 class TravelCourseSpotResponse(TravelCourseSpotBase):
@@ -156,11 +164,13 @@ class TravelCourseSpotResponse(TravelCourseSpotBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
 
 class TravelCourseSpotListResponse(BaseModel):
     """여행 코스 구성 지점 목록 응답 스키마"""
 
+    model_config = ConfigDict(defer_build=True)
+
     items: list[TravelCourseSpotResponse]
     total: int
\ No newline at end of file
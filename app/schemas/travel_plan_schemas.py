@@ -18,6 +18,8 @@ class TravelPlanStatus(enum.Enum):
 
 class TravelPlanBase(BaseModel):
     """여행 계획 기본 스키마"""
+    model_config = ConfigDict(defer_build=True)
+
     title: str
     description: Optional[str] = None
     start_date: Optional[date] = None
@@ -39,6 +41,8 @@ class TravelPlanCreate(TravelPlanBase):
 
 class TravelPlanUpdate(BaseModel):
     """여행 계획 수정 스키마"""
+    model_config = ConfigDict(defer_build=True)
+
     title: Optional[str] = None
     description: Optional[str] = None
     start_date: Optional[date] = None
@@ -60,4 +64,4 @@ class TravelPlanResponse(TravelPlanBase):
     created_at: datetime
     updated_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
\ No newline at end of file
@@ -1,47 +1,31 @@
-import enum
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from ..validators import CommonValidators
-
-
-class UserRole(enum.Enum):
-    """사용자 역할"""
-
-    USER = "USER"
-    ADMIN = "ADMIN"
+from ._enums import UserRole
+from ..validators import CommonValidators, UserPreferences, ValidatedEmail
 
 
 class UserBase(BaseModel):
     """사용자 기본 정보"""
 
-    email: str
+    model_config = ConfigDict(defer_build=True)
+
+    email: ValidatedEmail
     nickname: str
     profile_image: str | None = None
-    preferences: dict[str, Any] | None = None
+    preferences: UserPreferences = None
     preferred_region: str | None = None
     preferred_theme: str | None = None
     bio: str | None = None
 
-    @field_validator("preferences", mode="before")
-    @classmethod
-    def validate_preferences(cls, v):
-        """preferences 필드 검증 - 빈 배열이나 None을 빈 딕셔너리로 변환"""
-        return CommonValidators.validate_preferences(v)
-
-    @field_validator("email", mode="before")
-    @classmethod
-    def validate_email(cls, v):
-        return CommonValidators.validate_email(v)
-
 
 class UserCreate(UserBase):
     """사용자 생성 요청"""
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True, use_enum_values=True)
 
     password: str = Field(..., min_length=8, description="비밀번호 (최소 8자)")
     role: UserRole = Field(default=UserRole.USER, description="사용자 역할")
@@ -60,6 +44,8 @@ class UserCreate(UserBase):
 class UserUpdate(BaseModel):
     """사용자 정보 수정 요청"""
 
+    model_config = ConfigDict(defer_build=True)
+
     nickname: str | None = None
     profile_image: str | None = None
     preferences: dict[str, Any] | None = None
@@ -71,7 +57,7 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     """사용자 정보 응답"""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
     user_id: UUID
     is_active: bool
@@ -88,7 +74,7 @@ class UserResponse(UserBase):
 class UserListResponse(BaseModel):
     """사용자 목록 응답 (Deprecated: PaginatedResponse[UserResponse] 사용 권장)"""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
 
     users: list[UserResponse]
     total: int
@@ -106,6 +92,8 @@ class UserDetailResponse(UserResponse):
 class UserStats(BaseModel):
     """사용자 통계"""
 
+    model_config = ConfigDict(defer_build=True)
+
     total_users: int
     active_users: int
     verified_users: int
@@ -118,7 +106,7 @@ class UserStats(BaseModel):
 class UserSearchParams(BaseModel):
     """사용자 검색 파라미터"""
 
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(defer_build=True, use_enum_values=True)
 
     email: str | None = None
     nickname: str | None = None
@@ -5,12 +5,12 @@ from datetime import datetime, timedelta
 
 from fastapi import Depends
 from passlib.context import CryptContext
+from pydantic import ConfigDict, TypeAdapter
 from sqlalchemy import desc, or_, text
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import User
-from ..models import UserRole as DBUserRole
 from ..schemas.user_schemas import (
     UserCreate,
     UserListResponse,
@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 # 비밀번호 해싱을 위한 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 사용자 목록 검증기 (스키마 정의 시점이 아닌 첫 조회 시 한 번만 생성)
+_USER_LIST = TypeAdapter(list[UserResponse], config=ConfigDict(defer_build=True))
+
 
 class UserService:
     """사용자 관리 서비스"""
@@ -57,9 +60,7 @@ class UserService:
                 bio=user_create.bio,
                 is_active=True,
                 is_email_verified=False,
-                role=DBUserRole.USER
-                if user_create.role == UserRole.USER
-                else DBUserRole.ADMIN,
+                role=UserRole(user_create.role),
                 login_count=0,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow(),
@@ -125,12 +126,7 @@ class UserService:
                     )
 
                 if search_params.role:
-                    db_role = (
-                        DBUserRole.USER
-                        if search_params.role == UserRole.USER
-                        else DBUserRole.ADMIN
-                    )
-                    query = query.filter(User.role == db_role)
+                    query = query.filter(User.role == UserRole(search_params.role))
 
                 if search_params.is_active is not None:
                     query = query.filter(User.is_active == search_params.is_active)
@@ -164,12 +160,13 @@ class UserService:
                 query.order_by(desc(User.created_at)).offset(offset).limit(size).all()
             )
 
-            user_responses = [UserResponse.model_validate(user) for user in users]
+            user_responses = _USER_LIST.validate_python(users, from_attributes=True)
 
             # 총 페이지 수 계산
             total_pages = math.ceil(total / size)
 
-            return UserListResponse(
+            # 항목은 이미 검증되었으므로 목록 응답은 재검증 없이 구성
+            return UserListResponse.model_construct(
                 users=user_responses,
                 total=total,
                 page=page,
@@ -201,7 +198,7 @@ class UserService:
             )
             admin_users = (
                 self.db.query(User)
-                .filter(User.role == DBUserRole.ADMIN, ~User.email.like("deleted_%"))
+                .filter(User.role == UserRole.ADMIN, ~User.email.like("deleted_%"))
                 .count()
             )
 
@@ -1,8 +1,10 @@
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
-import requests
+import httpx
 
 from ..config import settings
 from ..weather.models import (
@@ -16,6 +18,35 @@ from ..weather.models import (
 
 logger = logging.getLogger(__name__)
 
+# 현재 날씨 조회 결과 메모리 캐시 보관 시간 (초) 및 최대 항목 수
+CURRENT_WEATHER_CACHE_TTL = 300
+CURRENT_WEATHER_CACHE_MAXSIZE = 256
+
+
+class _TTLCache:
+    """만료 시간과 최대 크기를 가진 간단한 메모리 캐시 (가장 오래된 항목부터 제거)"""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._store: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any | None:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            self._store.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Any, value: Any):
+        self._store.pop(key, None)
+        if len(self._store) >= self.maxsize:
+            self._store.pop(next(iter(self._store)))
+        self._store[key] = (time.monotonic(), value)
+
 
 class KTOWeatherService:
     """한국관광공사 날씨(또는 관광) API 서비스"""
@@ -33,6 +64,16 @@ class KTOWeatherService:
         if not self.base_url:
             logger.warning("KTO API URL이 설정되지 않았습니다!")
 
+        # 공유 HTTP 클라이언트 (커넥션 풀 재사용으로 요청마다 TLS 핸드셰이크를 하지 않음)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+        # 현재 날씨 캐시 및 진행 중인 조회 작업 (nx, ny, 지역명, 발표일자, 발표시각) 단위
+        self._current_cache = _TTLCache(CURRENT_WEATHER_CACHE_TTL, CURRENT_WEATHER_CACHE_MAXSIZE)
+        self._current_inflight: dict[tuple[int, int, str, str, str], asyncio.Task] = {}
+
         # 기상청 자료구분코드 매핑
         self.category_mapping = {
             # 초단기실황
@@ -77,7 +118,11 @@ class KTOWeatherService:
             "4": "흐림"
         }
 
-    def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any] | None:
+    async def aclose(self):
+        """HTTP 클라이언트 종료"""
+        await self.client.aclose()
+
+    async def _make_request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any] | None:
         """API 요청 실행"""
         try:
             params["ServiceKey"] = self.api_key
@@ -86,19 +131,19 @@ class KTOWeatherService:
             logger.info(f"KTO API 요청: {url}")
             logger.info(f"파라미터: {params}")
 
-            response = requests.get(url, params=params, timeout=30)
+            response = await self.client.get(url, params=params)
             response.raise_for_status()
 
             return response.json()
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"KTO API 요청 실패: {e}")
             return None
         except Exception as e:
             logger.error(f"KTO API 응답 파싱 실패: {e}")
             return None
 
-    def get_ultra_srt_ncst(self, request: UltraSrtNcstRequest) -> WeatherResponse | None:
+    async def get_ultra_srt_ncst(self, request: UltraSrtNcstRequest) -> WeatherResponse | None:
         """초단기실황 조회"""
         params = {
             "pageNo": request.page_no,
@@ -110,7 +155,7 @@ class KTOWeatherService:
             "ny": request.ny
         }
 
-        response_data = self._make_request("getUltraSrtNcst", params)
+        response_data = await self._make_request("getUltraSrtNcst", params)
         if response_data:
             try:
                 return WeatherResponse(**response_data)
@@ -119,7 +164,7 @@ class KTOWeatherService:
                 return None
         return None
 
-    def get_ultra_srt_fcst(self, request: UltraSrtFcstRequest) -> WeatherResponse | None:
+    async def get_ultra_srt_fcst(self, request: UltraSrtFcstRequest) -> WeatherResponse | None:
         """초단기예보 조회"""
         params = {
             "pageNo": request.page_no,
@@ -131,7 +176,7 @@ class KTOWeatherService:
             "ny": request.ny
         }
 
-        response_data = self._make_request("getUltraSrtFcst", params)
+        response_data = await self._make_request("getUltraSrtFcst", params)
         if response_data:
             try:
                 return WeatherResponse(**response_data)
@@ -140,7 +185,7 @@ class KTOWeatherService:
                 return None
         return None
 
-    def get_vilage_fcst(self, request: VilageFcstRequest) -> WeatherResponse | None:
+    async def get_vilage_fcst(self, request: VilageFcstRequest) -> WeatherResponse | None:
         """단기예보 조회"""
         params = {
             "pageNo": request.page_no,
@@ -152,7 +197,7 @@ class KTOWeatherService:
             "ny": request.ny
         }
 
-        response_data = self._make_request("getVilageFcst", params)
+        response_data = await self._make_request("getVilageFcst", params)
         if response_data:
             try:
                 return WeatherResponse(**response_data)
@@ -181,10 +226,38 @@ class KTOWeatherService:
 
         return base_date, base_time_str
 
-    def get_current_weather(self, nx: int, ny: int, location_name: str = "") -> WeatherInfo | None:
-        """현재 날씨 정보 조회 (초단기실황)"""
-        base_date, base_time = self._get_current_base_time()
+    async def get_current_weather(self, nx: int, ny: int, location_name: str = "") -> WeatherInfo | None:
+        """
+        현재 날씨 정보 조회 (초단기실황)
 
+        캐시 키에 발표시각이 포함되므로 새 자료가 발표되면 자동으로 다시 조회합니다.
+        동시에 들어온 동일 요청은 하나의 기상청 API 호출로 합치며,
+        요청이 취소되어도 진행 중인 조회 작업은 취소되지 않도록 shield로 감쌉니다.
+        """
+        base_date, base_time = self._get_current_base_time()
+        key = (nx, ny, location_name, base_date, base_time)
+
+        cached = self._current_cache.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._current_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_current_weather(nx, ny, location_name, base_date, base_time)
+            )
+            self._current_inflight[key] = task
+            task.add_done_callback(lambda _: self._current_inflight.pop(key, None))
+
+        weather = await asyncio.shield(task)
+        if weather is not None:
+            self._current_cache.set(key, weather)
+        return weather
+
+    async def _request_current_weather(
+        self, nx: int, ny: int, location_name: str, base_date: str, base_time: str
+    ) -> WeatherInfo | None:
+        """기상청 초단기실황 API를 호출하여 현재 날씨 정보로 변환"""
         request = UltraSrtNcstRequest(
             base_date=base_date,
             base_time=base_time,
@@ -192,7 +265,7 @@ class KTOWeatherService:
             ny=ny
         )
 
-        response = self.get_ultra_srt_ncst(request)
+        response = await self.get_ultra_srt_ncst(request)
         if not response:
             logger.error("초단기실황 API 응답이 없습니다.")
             return None
@@ -230,7 +303,7 @@ class KTOWeatherService:
 
         return weather_list[0]
 
-    def get_weather_forecast(self, nx: int, ny: int, location_name: str = "") -> list[WeatherInfo]:
+    async def get_weather_forecast(self, nx: int, ny: int, location_name: str = "") -> list[WeatherInfo]:
         """날씨 예보 정보 조회 (초단기예보 + 단기예보)"""
         weather_list = []
 
@@ -243,12 +316,6 @@ class KTOWeatherService:
             ny=ny
         )
 
-        ultra_response = self.get_ultra_srt_fcst(ultra_request)
-        if ultra_response and ultra_response.response.header.resultCode == "00":
-            ultra_weather = self._parse_weather_info(ultra_response, location_name, "ultra_forecast")
-            if ultra_weather:
-                weather_list.extend(ultra_weather)
-
         # 단기예보 (3일)
         # 단기예보는 02, 05, 08, 11, 14, 17, 20, 23시에 발표
         forecast_times = ["0200", "0500", "0800", "1100", "1400", "1700", "2000", "2300"]
@@ -269,7 +336,17 @@ class KTOWeatherService:
             ny=ny
         )
 
-        vilage_response = self.get_vilage_fcst(vilage_request)
+        # 초단기예보와 단기예보를 동시에 요청
+        ultra_response, vilage_response = await asyncio.gather(
+            self.get_ultra_srt_fcst(ultra_request),
+            self.get_vilage_fcst(vilage_request)
+        )
+
+        if ultra_response and ultra_response.response.header.resultCode == "00":
+            ultra_weather = self._parse_weather_info(ultra_response, location_name, "ultra_forecast")
+            if ultra_weather:
+                weather_list.extend(ultra_weather)
+
         if vilage_response and vilage_response.response.header.resultCode == "00":
             vilage_weather = self._parse_weather_info(vilage_response, location_name, "short_forecast")
             if vilage_weather:
@@ -426,14 +503,14 @@ class KTOWeatherService:
             for city in MAJOR_CITIES.values()
         ]
 
-    def get_current_weather_by_city(self, city_name: str) -> WeatherInfo | None:
+    async def get_current_weather_by_city(self, city_name: str) -> WeatherInfo | None:
         """도시명으로 현재 날씨 조회"""
         if city_name not in MAJOR_CITIES:
             logger.error(f"지원하지 않는 도시: {city_name}")
             return None
 
         city = MAJOR_CITIES[city_name]
-        return self.get_current_weather(city.nx, city.ny, city.name)
+        return await self.get_current_weather(city.nx, city.ny, city.name)
 
 
 # 주요 도시 좌표 (기상청 격자 좌표)
@@ -599,6 +676,20 @@ MAJOR_CITIES = {
 }
 
 
+_weather_service: KTOWeatherService | None = None
+
+
 def get_weather_service() -> KTOWeatherService:
-    """WeatherService 인스턴스 반환"""
-    return KTOWeatherService()
+    """WeatherService 인스턴스 반환 (HTTP 커넥션 풀을 공유하는 단일 인스턴스)"""
+    global _weather_service
+    if _weather_service is None:
+        _weather_service = KTOWeatherService()
+    return _weather_service
+
+
+async def close_weather_service():
+    """애플리케이션 종료 시 WeatherService HTTP 클라이언트 정리"""
+    global _weather_service
+    if _weather_service is not None:
+        await _weather_service.aclose()
+        _weather_service = None
@@ -0,0 +1,59 @@
+"""
+백그라운드 작업 상태 저장소
+작업 상태를 Redis에 저장하고, Redis 장애로 저장하지 못한 상태는 프로세스 메모리에 보관
+"""
+
+import time
+from typing import Any
+
+import orjson
+
+from app.utils.response_cache import cache_get, cache_set
+
+# 작업 상태 기본 보관 시간 (초)
+DEFAULT_JOB_TTL = 24 * 60 * 60
+
+
+class JobStatusStore:
+    """
+    작업 ID 단위 상태 저장소
+
+    - 상태는 Redis에 저장하여 다른 워커에서도 조회할 수 있도록 합니다.
+    - Redis 저장에 실패하면 같은 프로세스에 상태를 보관하여 결과가 유실되지 않도록 하고,
+      조회 시 메모리에 보관된 상태(해당 워커의 최신 상태)를 우선 반환합니다.
+    """
+
+    def __init__(self, namespace: str, ttl: int = DEFAULT_JOB_TTL):
+        self.namespace = namespace
+        self.ttl = ttl
+        # job_id -> (만료 시각, 직렬화된 상태)
+        self._local: dict[str, tuple[float, bytes]] = {}
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.namespace}:{job_id}"
+
+    def _prune(self):
+        now = time.monotonic()
+        for job_id in [job_id for job_id, (expires_at, _) in self._local.items() if expires_at <= now]:
+            del self._local[job_id]
+
+    async def save(self, job_id: str, job: dict[str, Any]) -> bool:
+        """작업 상태 저장 (Redis에 저장했으면 True, 메모리에만 보관했으면 False)"""
+        value = orjson.dumps(job)
+        self._prune()
+        if await cache_set(self._key(job_id), value, self.ttl):
+            self._local.pop(job_id, None)
+            return True
+        self._local[job_id] = (time.monotonic() + self.ttl, value)
+        return False
+
+    def discard(self, job_id: str):
+        """메모리에 보관된 작업 상태 삭제 (작업 등록을 취소한 경우)"""
+        self._local.pop(job_id, None)
+
+    async def get(self, job_id: str) -> bytes | None:
+        """작업 상태 조회 (없으면 None)"""
+        local = self._local.get(job_id)
+        if local is not None and local[0] > time.monotonic():
+            return local[1]
+        return await cache_get(self._key(job_id))
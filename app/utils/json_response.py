@@ -0,0 +1,26 @@
+"""
+orjson 기반 JSON 응답 유틸리티
+dict/list 로 구성한 응답을 FastAPI 기본 인코더(jsonable_encoder) 없이 바로 직렬화
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+
+def _orjson_default(value: Any) -> Any:
+    """orjson이 기본 지원하지 않는 타입 변환 (DB numeric 컬럼의 Decimal)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+
+def orjson_response(content: Any) -> Response:
+    """
+    orjson으로 직렬화한 JSON 응답 생성 (기본 JSONResponse 인코더 우회)
+
+    datetime/date/UUID 는 orjson이 ISO 8601/표준 문자열로 직접 직렬화하므로 미리 변환하지 않습니다.
+    """
+    return Response(content=orjson.dumps(content, default=_orjson_default), media_type="application/json")
@@ -0,0 +1,304 @@
+"""
+Redis 기반 API 응답 캐시 유틸리티
+기상청 API/DB 조회 결과를 경로 + 쿼리 파라미터 단위로 캐싱
+"""
+
+import functools
+import inspect
+import json
+import logging
+import time
+from collections.abc import Callable, Collection
+from typing import Any
+
+import httpx
+import redis.asyncio as redis
+from fastapi import HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 네임스페이스
+DEFAULT_NAMESPACE = "weather"
+
+# Redis 장애 시 재연결을 시도하기까지 대기하는 시간 (초)
+REDIS_RETRY_INTERVAL = 30
+
+# 업스트림 장애 시 만료된(stale) 캐시를 대신 제공할 수 있는 최대 보관 시간 (초)
+DEFAULT_HARD_EXPIRE = 24 * 60 * 60
+
+_redis_client: redis.Redis | None = None
+_redis_retry_at = 0.0
+
+_REQUEST_PARAM = "_cache_request"
+
+# stale 캐시로 대체할 수 있는 업스트림(외부 API/Redis/DB) 오류
+_UPSTREAM_ERRORS = (httpx.HTTPError, redis.RedisError, SQLAlchemyError, TimeoutError, ConnectionError)
+
+# 캐시된 본문만으로 다시 만들 수 있는 응답 헤더 (그 외 헤더/쿠키가 있는 응답은 캐싱하지 않음)
+_PLAIN_RESPONSE_HEADERS = frozenset({"content-length", "content-type"})
+
+
+def get_redis_client() -> redis.Redis | None:
+    """
+    캐시용 Redis 클라이언트 반환
+
+    최근에 Redis 연결이 실패했다면 재시도 시각까지 None을 반환합니다.
+    """
+    global _redis_client
+    if time.monotonic() < _redis_retry_at:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.redis_url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+    return _redis_client
+
+
+def _mark_redis_unavailable(error: Exception):
+    """Redis 오류 발생 시 일정 시간 캐시를 우회하도록 표시"""
+    global _redis_retry_at
+    if time.monotonic() >= _redis_retry_at:
+        logger.warning(f"응답 캐시 Redis 사용 불가, {REDIS_RETRY_INTERVAL}초간 캐시를 우회합니다: {error}")
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+
+
+async def cache_get(key: str) -> bytes | None:
+    """캐시에서 값 조회 (Redis 장애 시 None)"""
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except redis.RedisError as e:
+        _mark_redis_unavailable(e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, expire: int) -> bool:
+    """캐시에 값 저장 (Redis 장애 시 무시하고 False 반환)"""
+    client = get_redis_client()
+    if client is None:
+        return False
+    try:
+        await client.set(key, value, ex=expire)
+    except redis.RedisError as e:
+        _mark_redis_unavailable(e)
+        return False
+    return True
+
+
+# 값이 일치할 때만 키를 삭제하는 스크립트 (다른 작업이 점유한 잠금을 해제하지 않도록)
+_DELETE_IF_EQUAL_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+async def cache_set_if_absent(key: str, value: bytes, expire: int) -> bool | None:
+    """키가 없을 때만 값 저장 (저장했으면 True, 이미 있으면 False, Redis 장애 시 None)"""
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        return bool(await client.set(key, value, ex=expire, nx=True))
+    except redis.RedisError as e:
+        _mark_redis_unavailable(e)
+        return None
+
+
+async def cache_delete_if_equal(key: str, value: bytes):
+    """키의 값이 value 와 같을 때만 삭제 (Redis 장애 시 무시)"""
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.eval(_DELETE_IF_EQUAL_SCRIPT, 1, key, value)
+    except redis.RedisError as e:
+        _mark_redis_unavailable(e)
+
+
+async def clear_cache(namespace: str = DEFAULT_NAMESPACE):
+    """네임스페이스에 속한 캐시 항목 전체 삭제"""
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        keys = [key async for key in client.scan_iter(match=f"{namespace}:*", count=500)]
+        if keys:
+            await client.delete(*keys)
+    except redis.RedisError as e:
+        _mark_redis_unavailable(e)
+
+
+async def close_response_cache():
+    """애플리케이션 종료 시 Redis 연결 정리"""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+def build_cache_key(
+    namespace: str,
+    request: Request,
+    key_params: Collection[str] | None = None,
+) -> str:
+    """
+    경로와 정렬된 쿼리 파라미터로 캐시 키 생성
+
+    key_params 가 주어지면 해당 쿼리 파라미터만 키에 포함하여
+    추적용 파라미터 등 응답과 무관한 값이 캐시를 분리하지 않도록 합니다.
+    """
+    items = request.query_params.multi_items()
+    if key_params is not None:
+        items = [(k, v) for k, v in items if k in key_params]
+    query = "&".join(f"{k}={v}" for k, v in sorted(items))
+    return f"{namespace}:{request.url.path}?{query}"
+
+
+def _cacheable_body(result: Any) -> bytes | None:
+    """
+    엔드포인트 반환값에서 캐시할 JSON 응답 본문 추출
+
+    Response 는 본문만으로 다시 만들 수 있는 경우(200 JSON, 추가 헤더/쿠키/백그라운드 작업 없음)에만 캐싱하고,
+    그 외에는 None을 반환합니다.
+    """
+    if not isinstance(result, Response):
+        return JSONResponse(content=jsonable_encoder(result)).body
+    body = getattr(result, "body", None)
+    if (
+        body is None
+        or result.status_code != 200
+        or result.media_type != "application/json"
+        or result.background is not None
+        or any(name not in _PLAIN_RESPONSE_HEADERS for name in result.headers.keys())
+    ):
+        return None
+    return body
+
+
+def _pack_entry(body: bytes, expire: int, hard_expire: int) -> bytes:
+    """캐시 항목을 생성 시각/만료 시각 정보와 함께 직렬화"""
+    now = time.time()
+    return json.dumps({
+        "generated_at": now,
+        "stale_at": now + expire,
+        "hard_expire_at": now + hard_expire,
+        "body": body.decode("utf-8"),
+    }).encode("utf-8")
+
+
+def _unpack_entry(raw: bytes) -> dict[str, Any] | None:
+    """캐시 항목 역직렬화 (형식이 맞지 않으면 None)"""
+    try:
+        return json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """
+    stale 캐시로 대체할 수 있는 오류인지 확인
+
+    HTTPException 은 5xx 와 404(날씨 서비스는 기상청 API 실패 시 데이터 없음으로 처리)만,
+    그 외 예외는 외부 API/Redis/DB 오류만 해당합니다. 코드 오류(TypeError 등)는 그대로 전파합니다.
+    """
+    if isinstance(error, HTTPException):
+        return error.status_code == 404 or error.status_code >= 500
+    return isinstance(error, _UPSTREAM_ERRORS)
+
+
+def _json_response(body: str | bytes, cache_status: str, status_code: int = 200) -> Response:
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers={"X-Cache": cache_status},
+    )
+
+
+def cached_response(
+    expire: int,
+    namespace: str = DEFAULT_NAMESPACE,
+    stale_on_error: bool = False,
+    hard_expire: int = DEFAULT_HARD_EXPIRE,
+    key_params: Collection[str] | None = None,
+):
+    """
+    GET 엔드포인트 응답을 Redis에 캐싱하는 데코레이터
+
+    - 캐시 키: 네임스페이스 + 요청 경로 + 정렬된 쿼리 파라미터
+      (key_params 가 주어지면 해당 파라미터만 사용)
+    - 예외(HTTPException 포함)가 발생한 응답은 캐싱하지 않습니다.
+    - Redis를 사용할 수 없으면 캐시 없이 엔드포인트를 그대로 실행합니다.
+    - 응답에 X-Cache(HIT/MISS/stale-on-error) 헤더를 추가합니다.
+    - 엔드포인트가 헤더/쿠키/백그라운드 작업을 설정한 Response 를 반환하면 캐싱하지 않고 그대로 반환합니다.
+    - stale_on_error=True 이면 expire 이후에도 hard_expire 까지 항목을 보관하고,
+      엔드포인트가 실패하거나 None을 반환할 때 마지막 응답을 대신 반환합니다.
+    """
+    ttl = max(expire, hard_expire) if stale_on_error else expire
+
+    def decorator(func: Callable[..., Any]):
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters.values())
+        # Request 파라미터를 엔드포인트 시그니처에 주입하여 FastAPI가 전달하도록 함
+        parameters.append(
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        )
+        is_coroutine = inspect.iscoroutinefunction(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs.pop(_REQUEST_PARAM)
+            key = build_cache_key(namespace, request, key_params)
+
+            raw = await cache_get(key)
+            entry = _unpack_entry(raw) if raw is not None else None
+            if entry is not None and time.time() < entry["stale_at"]:
+                return _json_response(entry["body"], "HIT")
+
+            def stale_response() -> Response | None:
+                if stale_on_error and entry is not None and time.time() < entry["hard_expire_at"]:
+                    logger.warning(f"업스트림 실패로 만료된 캐시 응답을 반환합니다: {key}")
+                    return _json_response(entry["body"], "stale-on-error")
+                return None
+
+            try:
+                if is_coroutine:
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await run_in_threadpool(func, *args, **kwargs)
+            except Exception as e:
+                fallback = stale_response() if _is_upstream_failure(e) else None
+                if fallback is None:
+                    raise
+                return fallback
+
+            if result is None:
+                fallback = stale_response()
+                if fallback is not None:
+                    return fallback
+
+            body = _cacheable_body(result)
+            if body is not None:
+                await cache_set(key, _pack_entry(body, expire, ttl), ttl)
+            if isinstance(result, Response):
+                # 엔드포인트가 만든 응답을 그대로 사용하여 헤더/쿠키/백그라운드 작업 유지
+                result.headers["X-Cache"] = "MISS"
+                return result
+            return _json_response(body, "MISS")
+
+        wrapper.__signature__ = signature.replace(parameters=parameters)
+        return wrapper
+
+    return decorator
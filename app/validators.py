@@ -4,12 +4,31 @@
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import field_validator, ValidationInfo
+from pydantic import BeforeValidator, field_validator, ValidationInfo
 from pydantic_core import PydanticCustomError
 
+# 검증용 정규식 (호출마다 re 모듈의 패턴 캐시를 거치지 않도록 모듈 로드 시 한 번만 컴파일)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# 비밀번호 문자 종류: 영문, 숫자, 특수문자
+_PASSWORD_CHAR_CLASS_RES = (
+    re.compile(r'[a-zA-Z]'),
+    re.compile(r'[0-9]'),
+    re.compile(r'[!@#$%^&*(),.?":{}|<>]'),
+)
+_NICKNAME_INVALID_CHAR_RE = re.compile(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣]')
+_PHONE_INVALID_CHAR_RE = re.compile(r'[^\d-]')
+# 한국 전화번호 패턴 (010-1234-5678, 02-1234-5678 등)
+_PHONE_RES = (
+    re.compile(r'^01[0-9]-\d{3,4}-\d{4}$'),  # 휴대폰
+    re.compile(r'^0[2-6][0-9]?-\d{3,4}-\d{4}$'),  # 지역번호
+    re.compile(r'^070-\d{3,4}-\d{4}$'),  # 인터넷 전화
+)
+_REGION_CODE_RE = re.compile(r'^[0-9A-Za-z]+$')
+_URL_RE = re.compile(r'^https?:\/\/[\w\-._~:/?#[\]@!$&\'()*+,;=%]+$')
+
 
 class CommonValidators:
     """공통 validation 규칙들"""
@@ -20,8 +39,7 @@ class CommonValidators:
         if not email or '@' not in email:
             raise ValueError('유효하지 않은 이메일 형식입니다')
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        if not _EMAIL_RE.match(email):
             raise ValueError('올바른 이메일 형식이 아닙니다')
         
         return email.lower().strip()
@@ -39,13 +57,7 @@ class CommonValidators:
             raise ValueError('비밀번호는 100자를 초과할 수 없습니다')
         
         # 영문, 숫자, 특수문자 중 2가지 이상 포함
-        patterns = [
-            r'[a-zA-Z]',  # 영문
-            r'[0-9]',     # 숫자
-            r'[!@#$%^&*(),.?":{}|<>]'  # 특수문자
-        ]
-        
-        match_count = sum(1 for pattern in patterns if re.search(pattern, password))
+        match_count = sum(1 for pattern in _PASSWORD_CHAR_CLASS_RES if pattern.search(password))
         if match_count < 2:
             raise ValueError('비밀번호는 영문, 숫자, 특수문자 중 2가지 이상을 포함해야 합니다')
         
@@ -66,7 +78,7 @@ class CommonValidators:
             raise ValueError('닉네임은 20자를 초과할 수 없습니다')
         
         # 허용되지 않는 문자 검사
-        if re.search(r'[^\w\sㄱ-ㅎㅏ-ㅣ가-힣]', nickname):
+        if _NICKNAME_INVALID_CHAR_RE.search(nickname):
             raise ValueError('닉네임에는 한글, 영문, 숫자, 공백만 사용할 수 있습니다')
         
         return nickname
@@ -78,16 +90,9 @@ class CommonValidators:
             return None
         
         # 숫자와 하이픈만 허용
-        phone = re.sub(r'[^\d-]', '', phone)
-        
-        # 한국 전화번호 패턴 (010-1234-5678, 02-1234-5678 등)
-        phone_patterns = [
-            r'^01[0-9]-\d{3,4}-\d{4}$',  # 휴대폰
-            r'^0[2-6][0-9]?-\d{3,4}-\d{4}$',  # 지역번호
-            r'^070-\d{3,4}-\d{4}$',  # 인터넷 전화
-        ]
+        phone = _PHONE_INVALID_CHAR_RE.sub('', phone)
         
-        if not any(re.match(pattern, phone) for pattern in phone_patterns):
+        if not any(pattern.match(phone) for pattern in _PHONE_RES):
             raise ValueError('올바른 전화번호 형식이 아닙니다 (예: 010-1234-5678)')
         
         return phone
@@ -204,7 +209,7 @@ class CommonValidators:
         region_code = region_code.strip()
         
         # 지역 코드 형식: 숫자 또는 숫자+문자 조합
-        if not re.match(r'^[0-9A-Za-z]+$', region_code):
+        if not _REGION_CODE_RE.match(region_code):
             raise ValueError('지역 코드는 영숫자만 사용할 수 있습니다')
         
         if len(region_code) > 10:
@@ -221,8 +226,7 @@ class CommonValidators:
         url = url.strip()
         
         # 기본적인 URL 패턴 검증
-        url_pattern = r'^https?:\/\/[\w\-._~:/?#[\]@!$&\'()*+,;=%]+$'
-        if not re.match(url_pattern, url):
+        if not _URL_RE.match(url):
             raise ValueError('올바른 URL 형식이 아닙니다')
         
         if len(url) > 2000:
@@ -240,4 +244,12 @@ def create_field_validator(validator_func, field_name: str = None):
             return validator_func(v, current_field)
         return validator_func(v)
     
-    return field_validator(field_name if field_name else 'value', mode='before')(validator)
\ No newline at end of file
+    return field_validator(field_name if field_name else 'value', mode='before')(validator)
+
+
+# 여러 스키마가 공유하는 검증 필드 타입
+# (모델마다 classmethod validator를 두지 않고 검증 함수를 직접 참조)
+ValidatedEmail = Annotated[str, BeforeValidator(CommonValidators.validate_email)]
+UserPreferences = Annotated[
+    Dict[str, Any] | None, BeforeValidator(CommonValidators.validate_preferences)
+]
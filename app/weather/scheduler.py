@@ -1,9 +1,9 @@
+import asyncio
 import logging
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any
 
-from ..services.weather_service import KTOWeatherService
+from ..services.weather_service import KTOWeatherService, get_weather_service
 from .models import WeatherInfo
 
 logger = logging.getLogger(__name__)
@@ -12,8 +12,11 @@ logger = logging.getLogger(__name__)
 class WeatherDataCollector:
     """날씨 데이터 수집 및 저장 클래스"""
 
-    def __init__(self):
-        self.weather_service = KTOWeatherService()
+    @property
+    def weather_service(self) -> KTOWeatherService:
+        # 라우터와 같은 HTTP 커넥션 풀을 공유
+        # (종료 시 정리된 인스턴스를 붙잡지 않도록 사용할 때마다 현재 인스턴스를 조회)
+        return get_weather_service()
 
     async def collect_all_cities_weather(self, include_forecast: bool = False) -> dict[str, Any]:
         """모든 주요 도시의 날씨 데이터를 수집"""
@@ -68,48 +71,37 @@ class WeatherDataCollector:
 
     async def _collect_weather_parallel(self, cities: list[dict[str, Any]], include_forecast: bool) -> list[WeatherInfo]:
         """병렬로 날씨 데이터 수집"""
-        weather_data_list: list[WeatherInfo] = []
+        # 동시 요청 수 제한 (기상청 API 부하 방지)
+        semaphore = asyncio.Semaphore(5)
 
-        # ThreadPoolExecutor를 사용하여 병렬 처리
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # 각 도시에 대해 작업 제출
-            future_to_city: dict[Future[Any], dict[str, Any]] = {}
-
-            for city in cities:
+        async def collect(city: dict[str, Any]) -> WeatherInfo | None:
+            async with semaphore:
                 if include_forecast:
                     # 예보 데이터 포함
-                    future = executor.submit(self._get_city_forecast, city)
+                    weather_info = await self._get_city_forecast(city)
                 else:
                     # 현재 날씨만
-                    future = executor.submit(self._get_city_current_weather, city)
-                future_to_city[future] = city
-
-            # 완료된 작업들 처리
-            for future in as_completed(list(future_to_city.keys())):
-                city = future_to_city[future]
-                try:
-                    weather_info = future.result()
-                    if weather_info is not None:
-                        weather_data_list.append(weather_info)
-                        logger.info(f"Successfully collected weather data for {city['name']}")
-                except Exception as e:
-                    logger.error(f"Error collecting weather data for {city['name']}: {str(e)}")
-
-        return weather_data_list
-
-    def _get_city_current_weather(self, city: dict[str, Any]) -> WeatherInfo | None:
+                    weather_info = await self._get_city_current_weather(city)
+            if weather_info is not None:
+                logger.info(f"Successfully collected weather data for {city['name']}")
+            return weather_info
+
+        results = await asyncio.gather(*(collect(city) for city in cities))
+        return [weather_info for weather_info in results if weather_info is not None]
+
+    async def _get_city_current_weather(self, city: dict[str, Any]) -> WeatherInfo | None:
         """특정 도시의 현재 날씨 조회"""
         try:
-            return self.weather_service.get_current_weather_by_city(city["name"])
+            return await self.weather_service.get_current_weather_by_city(city["name"])
         except Exception as e:
             logger.error(f"Error getting current weather for {city['name']}: {str(e)}")
             return None
 
-    def _get_city_forecast(self, city: dict[str, Any]) -> WeatherInfo | None:
+    async def _get_city_forecast(self, city: dict[str, Any]) -> WeatherInfo | None:
         """특정 도시의 예보 날씨 조회 (필요시 구현)"""
         try:
             # 현재는 현재 날씨만 반환 (나중에 예보 기능 추가 가능)
-            return self.weather_service.get_current_weather_by_city(city["name"])
+            return await self.weather_service.get_current_weather_by_city(city["name"])
         except Exception as e:
             logger.error(f"Error getting forecast for {city['name']}: {str(e)}")
             return None
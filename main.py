@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 
@@ -46,12 +47,45 @@ from app.routers.travel_courses_compatibility import (
 )
 from app.routers.users import router as users_router
 from app.routers.weather import router as weather_router
+from app.routers.websocket import job_notification_listener
 from app.routers.websocket import router as websocket_router
+from app.services.weather_service import close_weather_service
+from app.utils.response_cache import close_response_cache
 
 # 로깅 설정 초기화
 setup_logging(log_dir="logs", log_level="DEBUG" if settings.debug else "INFO")
 
 
+def warm_up_schemas():
+    """
+    defer_build 로 지연된 요청 경로 스키마의 validator를 미리 생성
+
+    모듈 import 시에는 스키마 생성을 미루고, 서버 시작 시 한 번에 생성하여
+    첫 요청이 validator 생성 비용을 부담하지 않도록 합니다.
+    """
+    from app.schemas import system, travel_plan_schemas, user_schemas
+
+    models = [
+        system.DatabaseStatus,
+        system.ExternalApiStatus,
+        system.ExternalApisStatus,
+        system.SystemStatusData,
+        system.SystemLogOut,
+        travel_plan_schemas.TravelPlanCreate,
+        travel_plan_schemas.TravelPlanUpdate,
+        travel_plan_schemas.TravelPlanResponse,
+        user_schemas.UserCreate,
+        user_schemas.UserUpdate,
+        user_schemas.UserResponse,
+        user_schemas.UserListResponse,
+        user_schemas.UserDetailResponse,
+        user_schemas.UserStats,
+        user_schemas.UserSearchParams,
+    ]
+    for model in models:
+        model.model_rebuild()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
@@ -61,6 +95,12 @@ async def lifespan(app: FastAPI):
     logging.info(f"디버그 모드: {settings.debug}")
     logging.info(f"서버 주소: http://{settings.host}:{settings.port}")
 
+    warm_up_schemas()
+
+    # 배치 작업 상태 알림(LISTEN/NOTIFY) 공용 연결 시작
+    # (실패하면 백그라운드에서 재연결하며 그동안 WebSocket 은 주기적 상태 확인으로 동작)
+    await job_notification_listener.start()
+
     # 개발 환경에서만 자동으로 테이블 생성 및 초기 데이터 설정
     if settings.debug:
         try:
@@ -75,6 +115,9 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    job_notification_listener.close()
+    await close_response_cache()
+    await close_weather_service()
     logging.info(f"🛑 {settings.app_name} 종료")
 
 
@@ -108,6 +151,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 (1KB 이상 JSON 응답을 gzip으로 압축)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # RBAC 미들웨어 추가 (임시 비활성화)
 # app.add_middleware(RBACMiddleware)
 
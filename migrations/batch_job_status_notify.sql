@@ -0,0 +1,34 @@
+-- 배치 작업 상태 변경 알림 트리거
+-- batch_job_executions 의 상태/진행률이 바뀌면 NOTIFY "job_<작업 ID>" 채널로 변경 내용을 발행합니다.
+-- WebSocket(/api/ws/jobs/{job_id}/logs/stream)은 이 채널을 LISTEN 하여
+-- 주기적 조회를 기다리지 않고 변경 즉시 job_update 메시지를 전송합니다.
+-- NOTIFY 는 트랜잭션 커밋 시점에 전달되므로 롤백된 변경은 알림되지 않습니다.
+
+CREATE OR REPLACE FUNCTION notify_batch_job_status() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify(
+        'job_' || NEW.id,
+        json_build_object(
+            'status', NEW.status,
+            'progress', NEW.progress,
+            'current_step', NEW.current_step,
+            'total_steps', NEW.total_steps
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_batch_job_status_notify ON batch_job_executions;
+
+-- 진행 상황 컬럼 값이 실제로 바뀐 경우에만 알림
+CREATE TRIGGER trg_batch_job_status_notify
+AFTER UPDATE OF status, progress, current_step, total_steps ON batch_job_executions
+FOR EACH ROW
+WHEN (
+    OLD.status IS DISTINCT FROM NEW.status
+    OR OLD.progress IS DISTINCT FROM NEW.progress
+    OR OLD.current_step IS DISTINCT FROM NEW.current_step
+    OR OLD.total_steps IS DISTINCT FROM NEW.total_steps
+)
+EXECUTE FUNCTION notify_batch_job_status();
@@ -0,0 +1,45 @@
+-- 날씨 조회 엔드포인트 성능 최적화를 위한 인덱스
+-- weather_current / weather_forecast 테이블은 배치 시스템에서 적재되므로
+-- 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY 로 생성합니다.
+
+-- 1. weather_current 지역별 최신 데이터 조회용 부분 인덱스
+-- /api/weather/database/current-data 는 avg_temp 가 있는 행만 사용하므로
+-- NULL 행을 인덱스에서 제외하여 지역별 최신 행을 바로 찾도록 합니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_weather_current_latest_nonnull
+ON weather_current (region_code, weather_date DESC, created_at DESC)
+WHERE avg_temp IS NOT NULL;
+
+-- 2. weather_forecast 지역별 최신 예보 조회용 커버링 인덱스
+-- /summary-forecast, /database/forecast-data 의 DISTINCT ON (region_code) 조회가
+-- 정렬 없이 인덱스 순서대로 지역별 첫 행만 읽도록 합니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_wf_region_latest
+ON weather_forecast (region_code, forecast_date DESC, created_at DESC)
+INCLUDE (min_temp, max_temp, weather_condition, precipitation_prob)
+WHERE min_temp IS NOT NULL AND max_temp IS NOT NULL;
+
+-- 3. 최근 N일 범위 필터용 BRIN 인덱스
+-- 예보/실황 조회는 모두 forecast_date(weather_date) >= CURRENT_DATE - N일 조건을 사용합니다.
+-- CURRENT_DATE 는 IMMUTABLE 함수가 아니므로 부분 인덱스 조건에 넣을 수 없고,
+-- 날짜 순으로 적재되는 테이블이므로 작은 BRIN 인덱스로 오래된 블록을 건너뜁니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_wf_forecast_date_brin
+ON weather_forecast USING brin (forecast_date);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_weather_current_weather_date_brin
+ON weather_current USING brin (weather_date);
+
+-- 4. 수집 시각 인덱스
+-- /collect/stats 의 오늘 수집 현황(created_at 반열린 범위), 마지막 수집 시간(MAX),
+-- 최근 24시간 이력(ORDER BY created_at DESC LIMIT) 조회에 사용됩니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_wf_created_at
+ON weather_forecast (created_at DESC);
+
+-- 5. api_raw_data 날씨 응답 조회용 부분 인덱스
+-- /update-empty-data 가 (지역명, 날짜)별 후보 응답을 created_at 범위로 찾을 때 사용됩니다.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_api_raw_data_weather_created_at
+ON api_raw_data (created_at DESC)
+WHERE api_provider = 'WEATHER' AND response_status = 200;
+
+-- 통계 정보 업데이트
+ANALYZE weather_current;
+ANALYZE weather_forecast;
+ANALYZE api_raw_data;
@@ -0,0 +1,44 @@
+"""
+공용 테스트 픽스처
+"""
+import pytest
+
+from app.utils import job_status
+
+
+class FakeRedis:
+    """응답 캐시 Redis 함수를 대신하는 메모리 저장소 (available=False 이면 Redis 장애)"""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.available = True
+
+    async def get(self, key):
+        return self.data.get(key) if self.available else None
+
+    async def set(self, key, value, expire):
+        if not self.available:
+            return False
+        self.data[key] = value
+        return True
+
+    async def set_if_absent(self, key, value, expire):
+        if not self.available:
+            return None
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete_if_equal(self, key, value):
+        if self.available and self.data.get(key) == value:
+            del self.data[key]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """작업 상태 저장소가 메모리 저장소를 사용하도록 설정"""
+    fake = FakeRedis()
+    monkeypatch.setattr(job_status, "cache_get", fake.get)
+    monkeypatch.setattr(job_status, "cache_set", fake.set)
+    return fake
@@ -0,0 +1,75 @@
+"""
+관리자 응답 스키마 테스트
+"""
+from datetime import datetime
+
+from app.models_admin import AdminStatus as ModelAdminStatus
+from app.schemas.admin_schemas import AdminResponse
+
+
+def _admin(**overrides):
+    data = {
+        "admin_id": 7,
+        "email": "manager@example.com",
+        "name": None,
+        "phone": None,
+        "status": "ACTIVE",
+        "last_login_at": None,
+        "created_at": datetime(2026, 1, 1),
+    }
+    data.update(overrides)
+    return data
+
+
+class TestAdminResponseCompatFields:
+    """프론트엔드 호환 필드(username, id, is_active) 테스트"""
+
+    def test_computed_from_fields(self):
+        """username/id/is_active 는 다른 필드로부터 계산"""
+        admin = AdminResponse.model_validate(_admin())
+
+        dumped = admin.model_dump()
+        assert dumped["username"] == "manager"
+        assert dumped["id"] == 7
+        assert dumped["is_active"] is True
+
+    def test_not_accepted_as_input(self):
+        """입력값으로 전달해도 계산값을 사용하고 입력 스키마에도 노출하지 않음"""
+        admin = AdminResponse.model_validate(_admin(username="other", id=1, is_active=False))
+
+        assert (admin.username, admin.id, admin.is_active) == ("manager", 7, True)
+        assert {"username", "id", "is_active"}.isdisjoint(AdminResponse.model_json_schema()["properties"])
+        serialization = AdminResponse.model_json_schema(mode="serialization")
+        assert {"username", "id", "is_active"} <= set(serialization["required"])
+
+    def test_follow_model_copy_and_construct(self):
+        """model_copy(update=...)/model_construct 결과에도 현재 값으로 계산"""
+        admin = AdminResponse.model_validate(_admin())
+
+        copied = admin.model_copy(update={"name": "관리자", "admin_id": 9, "status": "LOCKED"})
+        assert copied.model_dump()["username"] == "관리자"
+        assert copied.model_dump()["id"] == 9
+        assert copied.model_dump()["is_active"] is False
+
+        constructed = AdminResponse.model_construct(**_admin(admin_id=3))
+        assert constructed.model_dump()["id"] == 3
+        assert constructed.model_dump()["username"] == "manager"
+
+
+class TestAdminResponseStatus:
+    """관리자 상태 필드 테스트"""
+
+    def test_orm_enum_status(self):
+        """ORM 모델의 AdminStatus 값을 문자열로 변환"""
+        admin = AdminResponse.model_validate(_admin(status=ModelAdminStatus.LOCKED))
+
+        assert admin.status == "LOCKED"
+        assert admin.is_active is False
+
+    def test_null_status(self):
+        """status 가 NULL 인 관리자도 검증되며 비활성으로 표시"""
+        admin = AdminResponse.model_validate(_admin(status=None))
+
+        assert admin.status is None
+        assert admin.is_active is False
+        assert admin.model_dump()["status"] is None
@@ -0,0 +1,188 @@
+"""
+작업 상태 알림(LISTEN/NOTIFY) 리스너 테스트
+"""
+import asyncio
+import socket
+from collections import namedtuple
+
+import psycopg2
+import pytest
+
+from app.routers import websocket
+
+Notify = namedtuple("Notify", ["pid", "channel", "payload"])
+
+
+class FakeDBAPIConnection:
+    """소켓 쌍으로 알림 도착을 흉내 내는 psycopg2 연결"""
+
+    def __init__(self):
+        self.reader, self.writer = socket.socketpair()
+        self.notifies = []
+        self.executed = []
+        self.broken = False
+        self.closed = False
+
+    def fileno(self):
+        if self.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        return self.reader.fileno()
+
+    def poll(self):
+        self.reader.recv(1024)
+        if self.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def execute(self, statement):
+                connection.executed.append(repr(statement))
+
+            def close(self):
+                pass
+
+        return Cursor()
+
+    def close(self):
+        self.closed = True
+        self.reader.close()
+        self.writer.close()
+
+    def notify(self, channel, payload):
+        self.notifies.append(Notify(0, channel, payload))
+        self.writer.send(b"x")
+
+    def disconnect(self):
+        self.broken = True
+        self.writer.send(b"x")
+
+
+class FakeConnection:
+    """engine.raw_connection() 이 반환하는 풀 연결"""
+
+    def __init__(self):
+        self.dbapi_connection = FakeDBAPIConnection()
+
+    def cursor(self):
+        return self.dbapi_connection.cursor()
+
+
+class TestJobNotificationListener:
+    """공용 알림 연결 구독, 알림 전달, 재연결 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        monkeypatch.setattr(websocket, "RECONNECT_INITIAL_DELAY", 0.01)
+        self.connections = []
+        self.fail_connect = 0
+        self.listener = websocket.JobNotificationListener()
+
+        def connect():
+            if self.fail_connect:
+                self.fail_connect -= 1
+                raise psycopg2.OperationalError("could not connect to server")
+            connection = FakeConnection()
+            self.connections.append(connection)
+            return connection
+
+        monkeypatch.setattr(self.listener, "_connect", connect)
+
+    @property
+    def dbapi(self):
+        return self.connections[-1].dbapi_connection
+
+    def test_dispatch_to_subscribers(self):
+        """첫 구독 시 LISTEN, 알림은 해당 채널 구독자 모두에게 전달, 마지막 구독 해제 시 UNLISTEN"""
+
+        async def scenario():
+            await self.listener.start()
+            first = await self.listener.subscribe("j1")
+            second = await self.listener.subscribe("j1")
+            other = await self.listener.subscribe("j2")
+            assert self.dbapi.executed == [
+                "Composed([SQL('LISTEN '), Identifier('job_j1')])",
+                "Composed([SQL('LISTEN '), Identifier('job_j2')])",
+            ]
+
+            self.dbapi.notify("job_j1", '{"progress": 0.5}')
+            assert await asyncio.wait_for(first.get(), 1) == '{"progress": 0.5}'
+            assert await asyncio.wait_for(second.get(), 1) == '{"progress": 0.5}'
+            assert other.empty()
+
+            await self.listener.unsubscribe("j1", first)
+            await self.listener.unsubscribe("j1", second)
+            assert self.dbapi.executed[-1] == "Composed([SQL('UNLISTEN '), Identifier('job_j1')])"
+            self.listener.close()
+
+        asyncio.run(scenario())
+
+    def test_reconnect_after_connection_error(self):
+        """연결 오류 후 재연결하여 채널을 다시 LISTEN 하고 구독자에게 재확인 요청"""
+
+        async def scenario():
+            await self.listener.start()
+            queue = await self.listener.subscribe("j1")
+            broken = self.dbapi
+
+            self.fail_connect = 1
+            broken.disconnect()
+            assert await asyncio.wait_for(queue.get(), 1) is websocket._REFRESH
+
+            assert broken.closed
+            assert len(self.connections) == 2
+            assert self.dbapi.executed == ["Composed([SQL('LISTEN '), Identifier('job_j1')])"]
+            self.dbapi.notify("job_j1", '{"status": "COMPLETED"}')
+            assert await asyncio.wait_for(queue.get(), 1) == '{"status": "COMPLETED"}'
+            self.listener.close()
+
+        asyncio.run(scenario())
+
+    def test_start_retries_in_background(self):
+        """시작 시 연결에 실패해도 예외 없이 백그라운드에서 재연결"""
+
+        async def scenario():
+            self.fail_connect = 1
+            await self.listener.start()
+            assert not self.listener.available
+
+            for _ in range(100):
+                if self.listener.available:
+                    break
+                await asyncio.sleep(0.01)
+            assert self.listener.available
+            self.listener.close()
+
+        asyncio.run(scenario())
+
+    def test_close_stops_reconnect(self):
+        """종료 시 진행 중인 재연결 중단"""
+
+        async def scenario():
+            self.fail_connect = 100
+            await self.listener.start()
+            self.listener.close()
+            await asyncio.sleep(0.05)
+            assert not self.listener.available
+            assert self.connections == []
+
+        asyncio.run(scenario())
+
+
+class TestParseJobNotification:
+    """NOTIFY payload 파싱 테스트"""
+
+    def test_normalizes_like_job_status(self):
+        """트리거 payload 를 _job_status 와 같은 형식으로 변환"""
+        changes = websocket._parse_job_notification(
+            '{"status": "RUNNING", "progress": 1, "current_step": null, "total_steps": 3}'
+        )
+        assert changes == {"status": "RUNNING", "progress": 1.0, "current_step": None, "total_steps": 3}
+        assert websocket._parse_job_notification('{"progress": null}') == {"progress": 0.0}
+
+    def test_invalid_payload(self):
+        """형식이 맞지 않는 payload 는 None (데이터베이스 재조회)"""
+        assert websocket._parse_job_notification("not json") is None
+        assert websocket._parse_job_notification("[1]") is None
+        assert websocket._parse_job_notification('{"other": 1}') is None
@@ -0,0 +1,180 @@
+"""
+응답 캐시 데코레이터(cached_response) 테스트
+"""
+import inspect
+import json
+
+import httpx
+import pytest
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Response
+from fastapi.testclient import TestClient
+
+from app.utils import response_cache
+from app.utils.json_response import orjson_response
+from app.utils.response_cache import cached_response
+
+
+class TestCachedResponse:
+    """HIT/MISS, stale-on-error, hard expire, 응답 헤더 보존 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, fake_redis):
+        self.redis = fake_redis
+        monkeypatch.setattr(response_cache, "cache_get", fake_redis.get)
+        monkeypatch.setattr(response_cache, "cache_set", fake_redis.set)
+        self.app = FastAPI()
+        self.client = TestClient(self.app, raise_server_exceptions=False)
+        self.calls = 0
+        self.outcome = lambda: {"value": self.calls}
+
+    def _route(self, path="/data", **options):
+        @self.app.get(path)
+        @cached_response(expire=60, **options)
+        async def endpoint(q: int = 0):
+            self.calls += 1
+            return self.outcome()
+
+        return endpoint
+
+    def _age(self, stale: bool = True, hard_expired: bool = False):
+        """저장된 캐시 항목의 만료 시각을 과거로 변경"""
+        for key, raw in self.redis.data.items():
+            entry = json.loads(raw)
+            if stale:
+                entry["stale_at"] = 0
+            if hard_expired:
+                entry["hard_expire_at"] = 0
+            self.redis.data[key] = json.dumps(entry).encode()
+
+    def test_signature_injects_request_parameter(self):
+        """Request 파라미터를 키워드 전용으로 주입하고 기존 파라미터는 유지"""
+        endpoint = self._route()
+
+        parameters = inspect.signature(endpoint).parameters
+        assert list(parameters) == ["q", "_cache_request"]
+        assert parameters["_cache_request"].kind is inspect.Parameter.KEYWORD_ONLY
+        query_names = [p["name"] for p in self.app.openapi()["paths"]["/data"]["get"]["parameters"]]
+        assert query_names == ["q"]
+
+    def test_miss_then_hit(self):
+        """첫 요청은 MISS 후 저장, 이후 요청은 엔드포인트 실행 없이 HIT"""
+        self._route()
+
+        first = self.client.get("/data", params={"q": 1})
+        second = self.client.get("/data", params={"q": 1})
+        other = self.client.get("/data", params={"q": 2})
+
+        assert (first.headers["X-Cache"], first.json()) == ("MISS", {"value": 1})
+        assert (second.headers["X-Cache"], second.json()) == ("HIT", {"value": 1})
+        assert other.headers["X-Cache"] == "MISS"
+        assert self.calls == 2
+
+    def test_refresh_after_expire(self):
+        """expire 이후에는 엔드포인트를 다시 실행"""
+        self._route()
+        self.client.get("/data")
+        self._age()
+
+        response = self.client.get("/data")
+
+        assert (response.headers["X-Cache"], response.json()) == ("MISS", {"value": 2})
+
+    def test_stale_on_upstream_error(self):
+        """업스트림 오류(5xx, httpx 오류, None 반환) 시 만료된 캐시 응답 반환"""
+        self._route(stale_on_error=True)
+        self.client.get("/data")
+        self._age()
+
+        for failure in (
+            HTTPException(status_code=502, detail="upstream"),
+            httpx.ConnectError("KMA down"),
+            None,
+        ):
+            def outcome(failure=failure):
+                if failure is None:
+                    return None
+                raise failure
+
+            self.outcome = outcome
+            response = self.client.get("/data")
+            assert response.status_code == 200
+            assert response.headers["X-Cache"] == "stale-on-error"
+            assert response.json() == {"value": 1}
+
+    def test_no_stale_for_code_or_client_errors(self):
+        """코드 오류(TypeError)와 4xx 요청 오류는 stale 캐시로 숨기지 않음"""
+        self._route(stale_on_error=True)
+        self.client.get("/data")
+        self._age()
+
+        def type_error():
+            raise TypeError("bug")
+
+        self.outcome = type_error
+        assert self.client.get("/data").status_code == 500
+
+        def bad_request():
+            raise HTTPException(status_code=400, detail="잘못된 요청")
+
+        self.outcome = bad_request
+        assert self.client.get("/data").status_code == 400
+
+    def test_no_stale_after_hard_expire(self):
+        """hard_expire 이후에는 업스트림 오류를 그대로 반환"""
+        self._route(stale_on_error=True)
+        self.client.get("/data")
+        self._age(hard_expired=True)
+
+        def failure():
+            raise HTTPException(status_code=503, detail="upstream")
+
+        self.outcome = failure
+        assert self.client.get("/data").status_code == 503
+
+    def test_no_stale_without_option(self):
+        """stale_on_error 가 없으면 만료된 캐시를 사용하지 않음"""
+        self._route()
+        self.client.get("/data")
+        self._age()
+
+        def failure():
+            raise HTTPException(status_code=503, detail="upstream")
+
+        self.outcome = failure
+        assert self.client.get("/data").status_code == 503
+
+    def test_plain_json_response_cached(self):
+        """추가 헤더가 없는 JSON Response 는 캐싱"""
+        self.outcome = lambda: orjson_response({"value": self.calls})
+        self._route()
+
+        first = self.client.get("/data")
+        second = self.client.get("/data")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert (second.headers["X-Cache"], second.json()) == ("HIT", {"value": 1})
+
+    def test_response_headers_and_background_kept(self):
+        """헤더/쿠키/백그라운드 작업이 있는 Response 는 그대로 반환하고 캐싱하지 않음"""
+        ran = []
+
+        def outcome():
+            tasks = BackgroundTasks()
+            tasks.add_task(ran.append, self.calls)
+            response = Response(content=b'{"value": 1}', media_type="application/json", background=tasks)
+            response.headers["X-Total-Count"] = "1"
+            response.set_cookie("session", "abc")
+            return response
+
+        self.outcome = outcome
+        self._route()
+
+        first = self.client.get("/data")
+        second = self.client.get("/data")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert first.headers["X-Total-Count"] == "1"
+        assert first.cookies["session"] == "abc"
+        assert second.headers["X-Cache"] == "MISS"
+        assert ran == [1, 2]
+        assert self.redis.data == {}
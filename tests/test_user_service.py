@@ -0,0 +1,76 @@
+"""
+사용자 서비스 역할 처리 테스트
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models import User
+from app.schemas._enums import UserRole
+from app.schemas.user_schemas import UserCreate, UserSearchParams
+from app.services import user_service
+from app.services.user_service import UserService
+
+
+class FakeQuery:
+    """filter() 조건을 기록하고 빈 결과를 반환하는 쿼리"""
+
+    def __init__(self):
+        self.criteria = []
+
+    def filter(self, *criteria):
+        self.criteria.extend(criteria)
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def offset(self, value):
+        return self
+
+    def limit(self, value):
+        return self
+
+    def count(self):
+        return 0
+
+    def all(self):
+        return []
+
+
+class TestUserServiceRole:
+    """create_user 와 role 필터의 역할 변환 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        monkeypatch.setattr(user_service, "pwd_context", MagicMock(hash=lambda password: "hashed"))
+        self.db = MagicMock()
+        self.service = UserService(self.db)
+        monkeypatch.setattr(self.service, "get_user_by_email", lambda email: None)
+
+    def _create(self, **overrides):
+        data = {"email": "user@example.com", "nickname": "사용자", "password": "password123"}
+        data.update(overrides)
+        self.service.create_user(UserCreate(**data))
+        return self.db.add.call_args.args[0]
+
+    def test_create_user_default_role(self):
+        """역할을 지정하지 않으면 USER 로 저장"""
+        assert self._create().role is UserRole.USER
+
+    @pytest.mark.parametrize("role", [UserRole.USER, UserRole.ADMIN])
+    def test_create_user_keeps_requested_role(self, role):
+        """요청한 역할 그대로 저장"""
+        assert self._create(role=role.value).role is role
+
+    @pytest.mark.parametrize("role", ["USER", "ADMIN"])
+    def test_role_filter(self, role):
+        """role 검색 조건은 요청한 역할로만 필터링"""
+        query = FakeQuery()
+        self.db.query.return_value = query
+
+        self.service.get_users(search_params=UserSearchParams(role=role))
+
+        role_criteria = [c for c in query.criteria if c.left.compare(User.__table__.c.role)]
+        assert len(role_criteria) == 1
+        assert role_criteria[0].right.value is UserRole(role)
@@ -0,0 +1,104 @@
+"""
+날씨 수집 백그라운드 작업 테스트
+"""
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import weather
+from app.utils import job_status
+
+
+class TestCollectJobs:
+    """/collect/* 작업 접수 및 상태 조회 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, fake_redis):
+        self.redis = fake_redis
+        monkeypatch.setattr(weather, "_collect_jobs", job_status.JobStatusStore("test_collect_job"))
+
+        async def clear_cache():
+            pass
+
+        monkeypatch.setattr(weather, "clear_cache", clear_cache)
+
+        app = FastAPI()
+        app.include_router(weather.router)
+        self.client = TestClient(app)
+        self.monkeypatch = monkeypatch
+        self.observed = []
+
+    def _collector(self, result=None, error=None):
+        """수집 중 조회한 작업 상태를 기록하는 가짜 수집기"""
+
+        async def collect(include_forecast=True):
+            job_id = next(iter(self.redis.data)).split(":")[-1]
+            self.observed.append(orjson.loads(await weather._collect_jobs.get(job_id)))
+            if error is not None:
+                raise error
+            return result
+
+        self.monkeypatch.setattr(weather.weather_collector, "collect_all_cities_weather", collect)
+
+    def _status(self, job_id):
+        return self.client.get(f"/weather/collect/status/{job_id}")
+
+    def test_collect_completed(self):
+        """202 접수 → 실행 중 → 완료 상태 전환"""
+        self._collector(result={"success_count": 3, "failed_count": 0})
+
+        response = self.client.post("/weather/collect/all")
+
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert self.observed[0]["status"] == "running"
+        assert self.observed[0]["include_forecast"] is True
+
+        status = self._status(job_id)
+        assert status.status_code == 200
+        assert status.json()["status"] == "completed"
+        assert status.json()["result"] == {"success_count": 3, "failed_count": 0}
+        assert status.json()["finished_at"] is not None
+
+    def test_collect_failed(self):
+        """수집 중 예외가 발생하면 failed 상태와 오류 메시지 저장"""
+        self._collector(error=RuntimeError("KMA down"))
+
+        response = self.client.post("/weather/collect/current")
+
+        assert response.status_code == 202
+        assert self.observed[0]["status"] == "running"
+        assert self.observed[0]["include_forecast"] is False
+        status = self._status(response.json()["job_id"]).json()
+        assert status["status"] == "failed"
+        assert status["error"] == "KMA down"
+
+    def test_collect_rejected_without_redis(self):
+        """작업 상태를 저장할 수 없으면 202 대신 503 반환"""
+        self._collector(result={})
+        self.redis.available = False
+
+        response = self.client.post("/weather/collect/all")
+
+        assert response.status_code == 503
+        assert self.observed == []
+
+    def test_result_kept_when_redis_fails_during_job(self):
+        """실행 중 Redis 장애가 발생해도 같은 프로세스에서 결과 조회 가능"""
+
+        async def collect(include_forecast=True):
+            self.redis.available = False
+            return {"success_count": 1, "failed_count": 0}
+
+        self.monkeypatch.setattr(weather.weather_collector, "collect_all_cities_weather", collect)
+
+        job_id = self.client.post("/weather/collect/all").json()["job_id"]
+
+        status = self._status(job_id)
+        assert status.status_code == 200
+        assert status.json()["status"] == "completed"
+
+    def test_unknown_job(self):
+        """존재하지 않는 작업은 404"""
+        assert self._status("missing").status_code == 404
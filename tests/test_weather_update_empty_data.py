@@ -0,0 +1,126 @@
+"""
+빈 날씨 데이터 업데이트 작업 테스트
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.routers import weather
+from app.utils import job_status
+
+
+class TestUpdateEmptyDataJobs:
+    """/update-empty-data 작업 접수, 실행 잠금, 상태 조회 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, fake_redis):
+        self.redis = fake_redis
+        monkeypatch.setattr(weather, "cache_set_if_absent", fake_redis.set_if_absent)
+        monkeypatch.setattr(weather, "cache_delete_if_equal", fake_redis.delete_if_equal)
+        monkeypatch.setattr(weather, "_update_empty_jobs", job_status.JobStatusStore("test_update_empty_job"))
+
+        app = FastAPI()
+        app.include_router(weather.router)
+        self.client = TestClient(app)
+        self.monkeypatch = monkeypatch
+
+    def _job(self, func):
+        self.monkeypatch.setattr(weather, "_update_empty_weather_data_in_session", func)
+
+    def _status(self, job_id):
+        return self.client.get(f"/weather/update-empty-data/status/{job_id}")
+
+    def test_update_completed(self):
+        """202 접수 → 완료 상태 저장 → 실행 잠금 해제"""
+        observed = []
+
+        def run():
+            observed.append(self.redis.data.get(weather._UPDATE_EMPTY_LOCK_KEY))
+            return {"success": True, "updated_count": 2}
+
+        self._job(run)
+
+        response = self.client.post("/weather/update-empty-data")
+
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert observed == [job_id.encode()]
+        status = self._status(job_id).json()
+        assert status["status"] == "completed"
+        assert status["result"] == {"success": True, "updated_count": 2}
+        assert weather._UPDATE_EMPTY_LOCK_KEY not in self.redis.data
+
+    def test_update_failed(self):
+        """작업 중 HTTPException 이 발생하면 failed 상태와 detail 저장"""
+
+        def run():
+            raise HTTPException(status_code=500, detail="업데이트 실패")
+
+        self._job(run)
+
+        job_id = self.client.post("/weather/update-empty-data").json()["job_id"]
+
+        status = self._status(job_id).json()
+        assert status["status"] == "failed"
+        assert status["error"] == "업데이트 실패"
+        assert weather._UPDATE_EMPTY_LOCK_KEY not in self.redis.data
+
+    def test_conflict_while_locked(self):
+        """다른 워커가 잠금을 점유 중이면 409, 점유한 잠금은 유지"""
+        self._job(MagicMock())
+        self.redis.data[weather._UPDATE_EMPTY_LOCK_KEY] = b"other-worker-job"
+
+        response = self.client.post("/weather/update-empty-data")
+
+        assert response.status_code == 409
+        assert self.redis.data[weather._UPDATE_EMPTY_LOCK_KEY] == b"other-worker-job"
+
+    def test_rejected_without_redis(self):
+        """Redis 를 사용할 수 없으면 작업을 시작하지 않고 503"""
+        run = MagicMock()
+        self._job(run)
+        self.redis.available = False
+
+        response = self.client.post("/weather/update-empty-data")
+
+        assert response.status_code == 503
+        run.assert_not_called()
+
+    def test_unknown_job(self):
+        """존재하지 않는 작업은 404"""
+        assert self._status("missing").status_code == 404
+
+
+class TestUpdateEmptyDataAdvisoryLock:
+    """일괄 UPDATE 트랜잭션 잠금 테스트"""
+
+    def _session(self, locked: bool):
+        db = MagicMock()
+        db.execute.return_value.scalar.return_value = locked
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = db
+        return session_factory
+
+    def test_conflict_when_lock_held(self, monkeypatch):
+        """다른 프로세스가 트랜잭션 잠금을 점유 중이면 409"""
+        update = MagicMock()
+        monkeypatch.setattr(weather, "SessionLocal", self._session(False))
+        monkeypatch.setattr(weather, "_update_empty_weather_data", update)
+
+        with pytest.raises(HTTPException) as exc_info:
+            weather._update_empty_weather_data_in_session()
+
+        assert exc_info.value.status_code == 409
+        update.assert_not_called()
+
+    def test_update_runs_with_lock(self, monkeypatch):
+        """잠금을 얻으면 같은 세션으로 업데이트 실행"""
+        session_factory = self._session(True)
+        update = MagicMock(return_value={"success": True})
+        monkeypatch.setattr(weather, "SessionLocal", session_factory)
+        monkeypatch.setattr(weather, "_update_empty_weather_data", update)
+
+        assert weather._update_empty_weather_data_in_session() == {"success": True}
+        update.assert_called_once_with(session_factory.return_value.__enter__.return_value)
@@ -0,0 +1,84 @@
+"""
+빈 날씨 데이터 일괄 업데이트 SQL 테스트 (PostgreSQL 필요)
+"""
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.routers import weather
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """트랜잭션 안에서 실행하고 종료 시 롤백하는 세션 (임시 테이블은 롤백 시 삭제)"""
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        pytest.skip("PostgreSQL 에 연결할 수 없습니다.")
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    # 컬럼 타입마다 일괄 업데이트 문을 다시 구성
+    monkeypatch.setattr(weather, "_empty_data_update_sql", None)
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+class TestBulkUpdateEmptyWeatherData:
+    """weather_current 컬럼 타입별 일괄 업데이트 테스트"""
+
+    @pytest.mark.parametrize(
+        ("id_type", "raw_data_id_type", "record_id"),
+        [
+            ("uuid", "uuid", str(uuid.uuid4())),
+            ("integer", "character varying(64)", "42"),
+            ("text", "uuid", "wc-1"),
+        ],
+    )
+    def test_matches_column_types(self, db, id_type, raw_data_id_type, record_id):
+        """id/raw_data_id 가 uuid, 정수, 문자열 중 어느 타입이어도 업데이트"""
+        # 임시 테이블이 같은 이름의 weather_current 보다 먼저 조회됨
+        db.execute(text(f"""
+            CREATE TEMP TABLE weather_current (
+                id {id_type} PRIMARY KEY,
+                precipitation double precision,
+                visibility numeric,
+                uv_index double precision,
+                raw_data_id {raw_data_id_type},
+                updated_at timestamp
+            ) ON COMMIT DROP
+        """))
+        db.execute(
+            text("INSERT INTO weather_current (id, visibility) VALUES (CAST(:id AS " + id_type + "), 5), (CAST(:other AS " + id_type + "), NULL)"),
+            {"id": record_id, "other": "7" if id_type == "integer" else str(uuid.uuid4())},
+        )
+        raw_data_id = str(uuid.uuid4())
+
+        updated_count, status = weather._bulk_update_empty_weather_data(db, [{
+            "id": record_id,
+            "precipitation": 2.5,
+            "visibility": None,
+            "uv_index": 4.0,
+            "raw_data_id": raw_data_id,
+        }])
+
+        assert updated_count == 1
+        assert (status.total, status.null_precipitation, status.null_visibility, status.null_uv_index) == (2, 1, 1, 1)
+        row = db.execute(text(
+            "SELECT precipitation, visibility, uv_index, raw_data_id::text AS raw_data_id, updated_at "
+            "FROM weather_current WHERE id::text = :id"
+        ), {"id": record_id}).one()
+        assert (row.precipitation, float(row.visibility), row.uv_index, row.raw_data_id) == (2.5, 5.0, 4.0, raw_data_id)
+        assert row.updated_at is not None
+
+    def test_missing_column(self, db):
+        """필요한 컬럼이 없으면 구성 단계에서 명확한 오류"""
+        db.execute(text("CREATE TEMP TABLE weather_current (id uuid PRIMARY KEY) ON COMMIT DROP"))
+
+        with pytest.raises(RuntimeError, match="precipitation"):
+            weather._bulk_update_empty_weather_data(db, [{"id": str(uuid.uuid4())}])
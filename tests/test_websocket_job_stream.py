@@ -0,0 +1,113 @@
+"""
+배치 작업 로그 WebSocket 메시지 형식 테스트
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.routers import websocket
+
+
+def _log(status, message=None):
+    return SimpleNamespace(
+        start_time=datetime(2026, 1, 1, 9, 0, 0),
+        status=status,
+        error_message=message,
+        job_name="weather",
+        job_type="WEATHER_DATA_COLLECTION",
+        duration=1.5,
+        result=None,
+    )
+
+
+class TestJobLogStream:
+    """기존 로그(log / log_batch)와 작업 상태 메시지 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.job = SimpleNamespace(
+            status="RUNNING",
+            progress=0.5,
+            current_step="collect",
+            total_steps=3,
+            logs=[_log("success"), _log("failed", "timeout")],
+        )
+        session = MagicMock()
+        # 초기 조회(selectinload 포함)와 상태 재조회 모두 같은 작업 반환
+        session.query.return_value.options.return_value.filter.return_value.first.side_effect = lambda: self.job
+        session.query.return_value.filter.return_value.first.side_effect = lambda: self.job
+        session_factory = MagicMock()
+        session_factory.return_value.__enter__.return_value = session
+        monkeypatch.setattr(websocket, "SessionLocal", session_factory)
+        # 알림 연결 없이 동작 (주기적 상태 확인)
+        monkeypatch.setattr(websocket, "job_notification_listener", websocket.JobNotificationListener())
+
+        app = FastAPI()
+        app.include_router(websocket.router)
+        self.client = TestClient(app)
+
+    def _url(self, **params):
+        query = "&".join(f"{key}={value}" for key, value in {"api_key": settings.batch_api_key, **params}.items())
+        return f"/ws/jobs/j1/logs/stream?{query}"
+
+    def test_per_row_log_frames_by_default(self):
+        """기본값은 기존 클라이언트와 같이 로그마다 log 메시지 전송"""
+        with self.client.websocket_connect(self._url()) as ws:
+            first = ws.receive_json()
+            second = ws.receive_json()
+            status = ws.receive_json()
+
+        assert first == {
+            "type": "log",
+            "timestamp": "2026-01-01T09:00:00",
+            "level": "INFO",
+            "message": "weather - success",
+            "details": {
+                "status": "success",
+                "job_name": "weather",
+                "job_type": "WEATHER_DATA_COLLECTION",
+                "duration": 1.5,
+                "result": None,
+            },
+            "historical": True,
+        }
+        assert (second["type"], second["level"], second["message"]) == ("log", "ERROR", "timeout")
+        assert status == {
+            "type": "job_update",
+            "data": {"status": "RUNNING", "progress": 0.5, "current_step": "collect", "total_steps": 3},
+        }
+
+    def test_log_batch_frame(self):
+        """log_batch=true 이면 기존 로그를 하나의 log_batch 메시지로 전송"""
+        with self.client.websocket_connect(self._url(log_batch="true")) as ws:
+            batch = ws.receive_json()
+            status = ws.receive_json()
+
+        assert batch["type"] == "log_batch"
+        assert batch["historical"] is True
+        assert [log["message"] for log in batch["logs"]] == ["weather - success", "timeout"]
+        assert "type" not in batch["logs"][0]
+        assert status["type"] == "job_update"
+
+    def test_log_batch_skipped_without_logs(self):
+        """기존 로그가 없으면 log_batch 메시지를 보내지 않음"""
+        self.job.logs = []
+        with self.client.websocket_connect(self._url(log_batch="true")) as ws:
+            assert ws.receive_json()["type"] == "job_update"
+
+    def test_status_request(self):
+        """ping 은 pong, 그 외 메시지는 최신 작업 상태로 응답"""
+        with self.client.websocket_connect(self._url(log_batch="true")) as ws:
+            ws.receive_json()
+            ws.receive_json()
+            ws.send_text("ping")
+            assert ws.receive_text() == "pong"
+
+            self.job.progress = 0.8
+            ws.send_text("status")
+            assert ws.receive_json()["data"]["progress"] == 0.8